@@ -1,7 +1,6 @@
 """Agent tools for cryptocurrency analysis."""
 
 from typing import List, Callable, Dict, Any
-from functools import wraps
 from langchain_core.tools import Tool
 
 from src.services.coin_service import CoinService
@@ -18,6 +17,27 @@ AMBIGUOUS_TERMS = ["it", "that", "this", "the token", "that token", "this token"
 ANALYSIS_TYPES = ["fundamental", "price", "sentiment", "technical"]
 
 
+def _lightwrap(wrapper: Callable, func: Callable) -> Callable:
+    """
+    Copy the identity attributes a tool wrapper actually needs.
+
+    Cheaper than functools.wraps, which also copies __module__,
+    __qualname__ and merges __dict__. __doc__ is kept because
+    create_analysis_tool formats the wrapped docstring.
+
+    Args:
+        wrapper: Wrapper function to decorate
+        func: Original function being wrapped
+
+    Returns:
+        The wrapper with name, docstring, and __wrapped__ set
+    """
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
 def handle_tool_errors(func: Callable) -> Callable:
     """
     Decorator to handle common tool errors consistently.
@@ -29,7 +49,6 @@ def handle_tool_errors(func: Callable) -> Callable:
         Wrapped function with error handling
     """
 
-    @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
@@ -61,7 +80,7 @@ def handle_tool_errors(func: Callable) -> Callable:
             progress.error(f"Unexpected error: {str(e)}")
             return f"An unexpected error occurred: {str(e)}. Please try again."
 
-    return wrapper
+    return _lightwrap(wrapper, func)
 
 
 def store_analysis_result(
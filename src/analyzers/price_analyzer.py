@@ -1,6 +1,7 @@
 """Price analysis module for cryptocurrency tokens."""
 
-import statistics
+import numpy as np
+
 from src.repositories.coin_repository import CoinRepository
 from src.core.interfaces import BaseAnalyzer
 
@@ -44,17 +45,16 @@ class PriceAnalyzer(BaseAnalyzer):
 
             # Calculate volatility
             if len(historical_7d) > 1:
-                prices_7d = [p["price"] for p in historical_7d]
-                volatility_7d = (
-                    statistics.stdev(prices_7d) / statistics.mean(prices_7d) * 100
+                prices_7d = historical_7d.prices
+                volatility_7d = float(
+                    prices_7d.std(ddof=1) / prices_7d.mean() * 100
                 )
             else:
                 volatility_7d = 0
 
             # Identify support and resistance levels
             if len(historical_30d) >= 30:
-                prices_30d = [p["price"] for p in historical_30d]
-                sorted_prices = sorted(prices_30d)
+                sorted_prices = np.sort(historical_30d.prices)
                 support_level = sorted_prices[
                     len(sorted_prices) // 4
                 ]  # 25th percentile
@@ -1,11 +1,19 @@
 """Sentiment analysis module for cryptocurrency tokens."""
 
+import io
 from datetime import datetime
+from functools import lru_cache
 
 from src.repositories.coin_repository import CoinRepository
 from src.core.interfaces import BaseAnalyzer
 
 
+@lru_cache(maxsize=4096)
+def _fmt_thousands(n: int) -> str:
+    """Format an integer with thousands separators, memoized across analyses."""
+    return format(n, ",")
+
+
 class SentimentAnalyzer(BaseAnalyzer):
     """Performs sentiment analysis on cryptocurrency tokens."""
 
@@ -33,11 +41,15 @@ class SentimentAnalyzer(BaseAnalyzer):
             # Get coin data once (cached, so subsequent calls are fast)
             # This provides symbol and is reused by get_community_data() and get_market_data()
             coin_data = self.repository.get_coin_data(coin_id)
-            coin_symbol = coin_data.get("symbol", "").upper()
+            if not coin_data:
+                return "Insufficient data available for sentiment analysis."
+            coin_symbol = coin_data.get("symbol_upper", "")
 
             # These methods internally call get_coin_data() but use cached data
             community_data = self.repository.get_community_data(coin_id)
             market_data = self.repository.get_market_data(coin_id)
+            if not market_data:
+                return "Insufficient market data available for sentiment analysis."
             fng_data = self.repository.get_fear_greed_index()
 
             twitter_followers = community_data.get("twitter_followers", 0)
@@ -49,10 +61,15 @@ class SentimentAnalyzer(BaseAnalyzer):
             price_change_7d = market_data.get("price_change_percentage_7d", 0)
 
             # Fetch latest news articles using repository method
-            # but we call it directly here since we already have coin_name and coin_symbol
-            news_articles = self.repository.get_news_articles(
-                coin_name, coin_symbol, page_size=10
-            )
+            # but we call it directly here since we already have coin_name and coin_symbol.
+            # Skip the fetch entirely when no NewsAPI key is configured - the news
+            # quota is metered, so don't even enter the request path.
+            if self.repository.newsapi_client.api_key:
+                news_articles = self.repository.get_news_articles(
+                    coin_name, coin_symbol, page_size=10
+                )
+            else:
+                news_articles = []
             news_count = len(news_articles)
 
             # Calculate sentiment score based on available data
@@ -111,15 +128,15 @@ class SentimentAnalyzer(BaseAnalyzer):
                         **Community Engagement:**"""
 
             if twitter_followers:
-                report += f"\n- Twitter Followers: {twitter_followers:,}"
+                report += f"\n- Twitter Followers: {_fmt_thousands(twitter_followers)}"
             if reddit_subscribers:
-                report += f"\n- Reddit Subscribers: {reddit_subscribers:,}"
+                report += f"\n- Reddit Subscribers: {_fmt_thousands(reddit_subscribers)}"
             if reddit_posts:
                 report += f"\n- Reddit Posts (48h): {reddit_posts:.0f}"
             if reddit_comments:
                 report += f"\n- Reddit Comments (48h): {reddit_comments:.0f}"
             if telegram_users:
-                report += f"\n- Telegram Members: {telegram_users:,}"
+                report += f"\n- Telegram Members: {_fmt_thousands(telegram_users)}"
 
             if not any([twitter_followers, reddit_subscribers, telegram_users]):
                 report += "\n- Limited community data available for this token"
@@ -182,9 +199,11 @@ class SentimentAnalyzer(BaseAnalyzer):
                 else:
                     report += ", showing relatively low discussion activity."
 
-            # News coverage section
+            # News coverage section - accumulate in a StringIO buffer so the
+            # article loop doesn't repeatedly copy the whole growing report
             if news_count > 0:
-                report += (
+                buf = io.StringIO()
+                buf.write(
                     f"\n\n**Latest News Coverage ({news_count} articles found):**\n"
                 )
                 # Show top 5 most recent articles
@@ -207,28 +226,35 @@ class SentimentAnalyzer(BaseAnalyzer):
                     else:
                         date_str = "Unknown date"
 
-                    report += f"{i}. **{title}**\n"
-                    report += f"   Source: {source} | Date: {date_str}\n"
+                    buf.write(f"{i}. **{title}**\n")
+                    buf.write(f"   Source: {source} | Date: {date_str}\n")
 
                     # Add URL if available
                     url = article.get("url")
                     if url:
-                        report += f"   Link: {url}\n"
-                    report += "\n"
+                        buf.write(f"   Link: {url}\n")
+                    buf.write("\n")
 
                 if news_count > 5:
-                    report += f"*... and {news_count - 5} more articles*\n"
+                    buf.write(f"*... and {news_count - 5} more articles*\n")
 
-                report += "\n**News Impact:**\n"
+                buf.write("\n**News Impact:**\n")
                 if news_count >= 8:
-                    report += "High news coverage indicates significant market attention and potential volatility. "
-                    report += "Monitor news developments closely as they can drive price movements."
+                    buf.write(
+                        "High news coverage indicates significant market attention and potential volatility. "
+                    )
+                    buf.write(
+                        "Monitor news developments closely as they can drive price movements."
+                    )
                 elif news_count >= 5:
-                    report += "Moderate news coverage suggests ongoing interest. "
-                    report += "Recent developments may influence market sentiment."
+                    buf.write("Moderate news coverage suggests ongoing interest. ")
+                    buf.write("Recent developments may influence market sentiment.")
                 else:
-                    report += "Limited recent news coverage. "
-                    report += "The token may be in a consolidation phase or awaiting major developments."
+                    buf.write("Limited recent news coverage. ")
+                    buf.write(
+                        "The token may be in a consolidation phase or awaiting major developments."
+                    )
+                report += buf.getvalue()
             elif news_count == 0 and self.repository.newsapi_client.api_key:
                 report += "\n\n**News Coverage:**\n"
                 report += "No recent news articles found for this cryptocurrency in the past 7 days. "
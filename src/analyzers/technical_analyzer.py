@@ -1,10 +1,68 @@
 """Technical analysis module for cryptocurrency tokens."""
 
-from typing import List
+from typing import Sequence
+
+import numpy as np
+
 from src.repositories.coin_repository import CoinRepository
 from src.core.interfaces import BaseAnalyzer
 
 
+def _tail_mean(cumsum: np.ndarray, n: int, period: int):
+    """Mean of the last `period` values given a zero-prefixed cumulative sum."""
+    if n < period:
+        return None
+    return float((cumsum[n] - cumsum[n - period]) / period)
+
+
+def _compute_indicators(prices_30d: np.ndarray, prices_90d: np.ndarray) -> tuple:
+    """
+    Compute all technical indicators in a single pass over the price arrays.
+
+    One cumulative sum per array turns each windowed average (SMA-7/20/50 and
+    the SMA-12/26 EMA approximations) into an O(1) slice subtraction instead
+    of a separate scan, and the RSI gains/losses are derived from one
+    vectorized diff.
+
+    Args:
+        prices_30d: 30-day price array
+        prices_90d: 90-day price array
+
+    Returns:
+        Tuple of (sma_7, sma_20, sma_50, ema_12, ema_26, rsi); entries are
+        None when there is not enough data for the window
+    """
+    n30 = len(prices_30d)
+    cumsum_30 = np.concatenate(([0.0], np.cumsum(prices_30d)))
+
+    sma_7 = _tail_mean(cumsum_30, n30, 7)
+    sma_20 = _tail_mean(cumsum_30, n30, 20)
+    ema_12 = _tail_mean(cumsum_30, n30, 12)
+    ema_26 = _tail_mean(cumsum_30, n30, 26)
+
+    if len(prices_90d) >= 50:
+        cumsum_90 = np.concatenate(([0.0], np.cumsum(prices_90d)))
+        sma_50 = _tail_mean(cumsum_90, len(prices_90d), 50)
+    else:
+        sma_50 = None
+
+    # RSI over the last 14 changes
+    rsi_period = 14
+    if n30 < rsi_period + 1:
+        rsi = None
+    else:
+        changes = np.diff(prices_30d[-(rsi_period + 1):])
+        avg_gain = float(np.clip(changes, 0.0, None).sum()) / rsi_period
+        avg_loss = float(np.clip(-changes, 0.0, None).sum()) / rsi_period
+        if avg_loss == 0:
+            rsi = 100
+        else:
+            rs = avg_gain / avg_loss
+            rsi = 100 - (100 / (1 + rs))
+
+    return sma_7, sma_20, sma_50, ema_12, ema_26, rsi
+
+
 class TechnicalAnalyzer(BaseAnalyzer):
     """Performs technical analysis on cryptocurrency tokens."""
 
@@ -17,13 +75,13 @@ class TechnicalAnalyzer(BaseAnalyzer):
         """
         self.repository = repository
 
-    def calculate_sma(self, prices: List[float], period: int) -> float:
+    def calculate_sma(self, prices: Sequence[float], period: int) -> float:
         """Calculate Simple Moving Average."""
         if len(prices) < period:
             return None
         return sum(prices[-period:]) / period
 
-    def calculate_rsi(self, prices: List[float], period: int = 14) -> float:
+    def calculate_rsi(self, prices: Sequence[float], period: int = 14) -> float:
         """Calculate Relative Strength Index."""
         if len(prices) < period + 1:
             return None
@@ -71,22 +129,14 @@ class TechnicalAnalyzer(BaseAnalyzer):
                 return "Insufficient historical data for technical analysis."
 
             current_price = market_data["current_price"]
-            prices_30d = [p["price"] for p in historical_30d]
-            prices_90d = [p["price"] for p in historical_90d]
-
-            # Calculate moving averages
-            sma_7 = self.calculate_sma(prices_30d, 7)
-            sma_20 = self.calculate_sma(prices_30d, 20)
-            sma_50 = (
-                self.calculate_sma(prices_90d, 50) if len(prices_90d) >= 50 else None
-            )
+            prices_30d = historical_30d.prices
+            prices_90d = historical_90d.prices
 
-            # Calculate RSI
-            rsi = self.calculate_rsi(prices_30d, 14)
-
-            # Calculate MACD (simplified)
-            ema_12 = self.calculate_sma(prices_30d, 12)  # Using SMA as approximation
-            ema_26 = self.calculate_sma(prices_30d, 26)
+            # Calculate moving averages, RSI, and MACD inputs in one fused pass
+            # (EMA-12/26 use SMA as approximation)
+            sma_7, sma_20, sma_50, ema_12, ema_26, rsi = _compute_indicators(
+                prices_30d, prices_90d
+            )
             macd_line = ema_12 - ema_26 if ema_12 and ema_26 else None
 
             # Build analysis report
@@ -1,7 +1,27 @@
 """Base API client with common functionality."""
 
+import re
+import sys
+import threading
 import time
+from collections import deque
+
 import requests
+import urllib3
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Only advertise Brotli when a decoder is importable, otherwise urllib3
+    # can't decompress the response body
+    import brotli  # noqa: F401
+
+    ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
 from typing import Dict, Any, Optional
 from abc import ABC
 
@@ -13,6 +33,48 @@ from src.config.constants import DEFAULT_TIMEOUT
 logger = get_logger(__name__)
 progress = get_progress_logger()
 
+# urllib3's ResponseError message for exhausted status retries reads
+# "too many 429 error responses"; the status is the only place it survives
+_RETRY_STATUS_RE = re.compile(r"too many (\d{3}) error responses")
+
+
+class TokenBucket:
+    """Client-side token bucket to pace request bursts.
+
+    Waiting a fraction of a second for a token is far cheaper than
+    triggering a 429 upstream and sitting out its multi-second
+    Retry-After backoff.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Token refill rate in tokens per second
+            burst: Maximum number of tokens (burst capacity)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
 class BaseAPIClient(ABC):
     """Base class for API clients with common request handling."""
@@ -23,6 +85,7 @@ class BaseAPIClient(ABC):
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = 2,
         service_name: Optional[str] = None,
+        requests_per_minute: Optional[int] = None,
     ):
         """
         Initialize API client.
@@ -32,12 +95,71 @@ class BaseAPIClient(ABC):
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for rate-limited requests (default: 2)
             service_name: Optional service name for progress messages
+            requests_per_minute: Optional client-side rate cap; requests over
+                the cap wait for a token instead of risking a 429
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.service_name = service_name or self._extract_service_name(base_url)
-        self._last_endpoint = None
+        # Progress messages only make sense on an interactive terminal with
+        # verbose enabled; cache the decision so the hot path can skip the
+        # message formatting entirely
+        try:
+            from src.config.settings import get_settings
+
+            verbose = get_settings().verbose
+        except Exception:
+            verbose = True
+        self._verbose = verbose and getattr(sys.stdout, "isatty", lambda: False)()
+        # Suppress repeat messages for recently seen endpoints, not just the
+        # immediately previous one, to cover interleaved call patterns
+        self._recent_endpoints = deque(maxlen=8)
+        # Circuit breaker: after retries exhaust on a 429, fail fast for a
+        # cool-down window instead of letting every subsequent call retry
+        # against an upstream that is already rate-limiting us
+        self._rate_limited_until = 0.0
+        self._bucket = (
+            TokenBucket(rate=requests_per_minute / 60.0, burst=requests_per_minute)
+            if requests_per_minute
+            else None
+        )
+
+        # Pooled session so repeated calls to the same host reuse the
+        # TCP/TLS connection instead of re-negotiating per request.
+        # Retries (429/5xx, jittered exponential backoff, Retry-After) are
+        # handled by urllib3 below the requests layer, which also reuses the
+        # connection across retry attempts.
+        retry = urllib3.util.Retry(
+            total=max_retries,
+            status_forcelist=[429, 500, 502, 503, 504],
+            backoff_factor=1,
+            backoff_jitter=0.5,
+            backoff_max=10,
+            respect_retry_after_header=True,
+            allowed_methods=["GET"],
+        )
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            max_retries=retry, pool_connections=10, pool_maxsize=20, pool_block=False
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Brotli is ~15-25% smaller than gzip for JSON, which matters for the
+        # multi-MB coins/list transfer
+        self._session.headers.update(
+            {"Accept-Encoding": ACCEPT_ENCODING, "Connection": "keep-alive"}
+        )
+
+    def close(self) -> None:
+        """Release the underlying connection pool."""
+        self._session.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def _extract_service_name(self, url: str) -> str:
         """Extract service name from URL."""
@@ -70,83 +192,91 @@ class BaseAPIClient(ABC):
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
-        # Show progress only on first attempt for this endpoint
-        if self._last_endpoint is None or self._last_endpoint != endpoint:
+        # Fail fast while the rate-limit circuit is open - no network call
+        if time.monotonic() < self._rate_limited_until:
+            raise APIError(
+                f"Rate limit circuit open for {self.service_name}. "
+                f"Please wait a few moments before trying again.",
+                status_code=429,
+                endpoint=endpoint,
+            )
+
+        # Show progress only for endpoints not recently announced
+        if self._verbose and endpoint not in self._recent_endpoints:
             progress.api_call(self.service_name)
-            self._last_endpoint = endpoint
-
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = requests.get(url, params=params, timeout=self.timeout)
-
-                # Handle rate limiting (429) with retry
-                if response.status_code == 429:
-                    if attempt < self.max_retries:
-                        # Calculate backoff: exponential with cap (1s, 2s, 4s, max 10s)
-                        backoff_time = min(2**attempt, 10)
-                        retry_after = response.headers.get("Retry-After")
-                        if retry_after:
-                            try:
-                                # Cap Retry-After to reasonable limit (max 10 seconds)
-                                retry_after_seconds = int(retry_after)
-                                backoff_time = min(retry_after_seconds, 10)
-                            except (ValueError, TypeError):
-                                pass
-
-                        progress.warning(
-                            f"Rate limit hit. Retrying in {backoff_time}s (attempt {attempt + 1}/{self.max_retries})..."
-                        )
-                        time.sleep(backoff_time)
-                        continue
-                    else:
-                        # Max retries reached - fail fast instead of waiting
-                        raise APIError(
-                            f"Rate limit exceeded for {url}. "
-                            f"Please wait a few minutes before trying again. "
-                            f"CoinGecko free tier allows ~50 calls/minute.",
-                            status_code=429,
-                            endpoint=endpoint,
-                        )
-
-                response.raise_for_status()
-                data = response.json()
-                # Show success only on first successful attempt
-                if attempt == 0:
-                    progress.success(
-                        f"Successfully received data from {self.service_name}"
-                    )
-                return data
-
-            except requests.exceptions.Timeout:
-                if attempt < self.max_retries:
-                    # Short backoff for timeouts (1-2 seconds)
-                    backoff = min(attempt + 1, 2)
-                    progress.warning(f"Request timeout. Retrying in {backoff}s...")
-                    time.sleep(backoff)
-                    continue
-                raise APIError(
-                    f"Request to {url} timed out after {self.timeout}s",
-                    endpoint=endpoint,
-                )
-            except requests.exceptions.HTTPError as e:
-                # Don't retry for non-429 errors
-                status_code = (
-                    response.status_code if hasattr(response, "status_code") else None
-                )
+            self._recent_endpoints.append(endpoint)
+
+        if self._bucket is not None:
+            self._bucket.acquire()
+
+        try:
+            response = self._session.get(url, params=params, timeout=self.timeout)
+        except requests.exceptions.Timeout:
+            raise APIError(
+                f"Request to {url} timed out after {self.timeout}s",
+                endpoint=endpoint,
+            )
+        except requests.exceptions.RetryError as e:
+            # Retries exhausted at the urllib3 layer. Pull the last status
+            # out of the wrapped MaxRetryError reason: only a genuine 429
+            # should open the breaker and get the rate-limit guidance;
+            # exhausted 5xx retries surface as the real HTTP error.
+            reason = str(getattr(e.args[0], "reason", e)) if e.args else str(e)
+            match = _RETRY_STATUS_RE.search(reason)
+            status = int(match.group(1)) if match else None
+            if status == 429:
+                self._rate_limited_until = time.monotonic() + 30
                 raise APIError(
-                    f"HTTP error {status_code} from {url}: {str(e)}",
-                    status_code=status_code,
+                    f"Rate limit exceeded for {url}. "
+                    f"Please wait a few minutes before trying again. "
+                    f"CoinGecko free tier allows ~50 calls/minute.",
+                    status_code=429,
                     endpoint=endpoint,
                 )
-            except requests.exceptions.RequestException as e:
-                if attempt < self.max_retries:
-                    progress.warning("Request failed. Retrying...")
-                    time.sleep(1)
-                    continue
+            if status is not None:
                 raise APIError(
-                    f"Request to {url} failed: {str(e)}",
+                    f"HTTP error {status} from {url} (retries exhausted)",
+                    status_code=status,
                     endpoint=endpoint,
                 )
+            raise APIError(
+                f"Request to {url} failed after retries: {reason}",
+                endpoint=endpoint,
+            )
+        except requests.exceptions.RequestException as e:
+            raise APIError(
+                f"Request to {url} failed: {str(e)}",
+                endpoint=endpoint,
+            )
+
+        # Reached when retries are disabled (max_retries=0) or the final
+        # attempt still returned an error status
+        if response.status_code == 429:
+            self._rate_limited_until = time.monotonic() + 30
+            raise APIError(
+                f"Rate limit exceeded for {url}. "
+                f"Please wait a few minutes before trying again. "
+                f"CoinGecko free tier allows ~50 calls/minute.",
+                status_code=429,
+                endpoint=endpoint,
+            )
+
+        # Direct status check instead of raise_for_status() - avoids
+        # constructing an HTTPError just to re-wrap it as APIError
+        if response.status_code >= 400:
+            raise APIError(
+                f"HTTP error {response.status_code} from {url}",
+                status_code=response.status_code,
+                endpoint=endpoint,
+            )
 
-        # Should never reach here, but just in case
-        raise APIError(f"Request to {url} failed after {self.max_retries} retries")
+        # orjson decodes the raw bytes directly, skipping requests' encoding
+        # detection and running several times faster on large payloads
+        if orjson is not None:
+            data = orjson.loads(response.content)
+        else:
+            data = response.json()
+        self._rate_limited_until = 0.0
+        if self._verbose:
+            progress.success(f"Successfully received data from {self.service_name}")
+        return data
@@ -1,21 +1,74 @@
 """CoinGecko API client."""
 
-from typing import Dict, Any, List
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional
+
+import requests
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from src.api.base_client import BaseAPIClient
-from src.config.constants import COINGECKO_BASE_URL, COIN_SYMBOL_MAPPINGS
-from src.core.exceptions import CoinNotFoundError
+from src.config.constants import (
+    COINGECKO_BASE_URL,
+    COIN_SYMBOL_MAPPINGS,
+    DEFAULT_CACHE_TTL,
+    RATE_LIMIT_CACHE_TTL,
+)
+from src.core.cache import Cache, PersistentCache
+from src.core.exceptions import APIError, CoinNotFoundError
 from src.core.progress import get_progress_logger
 
 progress = get_progress_logger()
 
+# Constant query params, built once instead of a fresh dict literal per call;
+# MappingProxyType keeps them read-only so they can be shared safely
+_COIN_DATA_PARAMS = MappingProxyType(
+    {
+        "localization": "false",
+        "tickers": "false",
+        "community_data": "true",
+        "developer_data": "false",
+        "sparkline": "false",
+    }
+)
+
 
 class CoinGeckoClient(BaseAPIClient):
     """Client for CoinGecko API."""
 
     def __init__(self):
         """Initialize CoinGecko client."""
-        super().__init__(COINGECKO_BASE_URL, service_name="CoinGecko")
+        # CoinGecko's free tier caps at roughly 30 req/min; pace slightly
+        # below it so bursts wait briefly instead of eating 429 backoffs
+        super().__init__(
+            COINGECKO_BASE_URL, service_name="CoinGecko", requests_per_minute=25
+        )
+        # Memoized coin list (a multi-MB response that changes slowly) plus
+        # id/symbol/name indexes so lookups are O(1) instead of a linear scan
+        self._coin_list_lock = threading.Lock()
+        self._coin_list: Optional[List[Dict[str, Any]]] = None
+        self._coin_list_fetched_at = 0.0
+        self._id_idx: Dict[str, str] = {}
+        self._symbol_idx: Dict[str, str] = {}
+        self._name_idx: Dict[str, str] = {}
+        # Client-level TTL cache for the hottest endpoints, so every consumer
+        # of this client benefits even without a repository in front of it
+        self._response_cache = Cache(default_ttl=DEFAULT_CACHE_TTL)
+        # Disk-backed cache so the coin list survives restarts; a cold start
+        # then skips the multi-MB download entirely. Falls back to
+        # memory-only if the cache directory is unavailable or the database
+        # file is corrupt/read-only.
+        try:
+            self._persistent_cache: Optional[PersistentCache] = PersistentCache()
+        except (OSError, sqlite3.Error):
+            self._persistent_cache = None
 
     def get_coin_id(self, query: str) -> str:
         """
@@ -39,17 +92,17 @@ class CoinGeckoClient(BaseAPIClient):
             progress.success(f"Found coin ID: {coin_id}")
             return coin_id
 
-        # Search in coin list
+        # Look up in the indexed coin list
         try:
-            coins = self.get_coin_list()
-            for coin in coins:
-                if (
-                    coin["id"] == query
-                    or coin["symbol"].lower() == query
-                    or coin["name"].lower() == query
-                ):
-                    progress.success(f"Found coin ID: {coin['id']}")
-                    return coin["id"]
+            self.get_coin_list()
+            coin_id = (
+                self._id_idx.get(query)
+                or self._symbol_idx.get(query)
+                or self._name_idx.get(query)
+            )
+            if coin_id:
+                progress.success(f"Found coin ID: {coin_id}")
+                return coin_id
         except Exception:
             pass
 
@@ -59,10 +112,81 @@ class CoinGeckoClient(BaseAPIClient):
         """
         Get list of all available coins.
 
+        The list is memoized with a TTL so repeated coin lookups don't
+        re-download the multi-MB response; the lookup indexes are rebuilt
+        whenever the list is refreshed.
+
         Returns:
             List of coin dictionaries
         """
-        return self.get("coins/list")
+        with self._coin_list_lock:
+            now = time.time()
+            if (
+                self._coin_list is not None
+                and now - self._coin_list_fetched_at < RATE_LIMIT_CACHE_TTL
+            ):
+                return self._coin_list
+
+            coins = None
+            if self._persistent_cache is not None:
+                coins = self._persistent_cache.get("coin_list")
+            if coins is None:
+                coins = self._fetch_coin_list()
+                if self._persistent_cache is not None:
+                    self._persistent_cache.set("coin_list", coins, ttl=86400)
+            self._coin_list = coins
+            self._coin_list_fetched_at = now
+            # setdefault keeps the FIRST coin for duplicate symbols/names,
+            # matching the linear scan this index replaced; CoinGecko lists
+            # plenty of copycat tickers later in the list
+            id_idx: Dict[str, str] = {}
+            symbol_idx: Dict[str, str] = {}
+            name_idx: Dict[str, str] = {}
+            for c in coins:
+                coin_id = c["id"]
+                id_idx[coin_id] = coin_id
+                symbol_idx.setdefault(c["symbol"].lower(), coin_id)
+                name_idx.setdefault(c["name"].lower(), coin_id)
+            self._id_idx = id_idx
+            self._symbol_idx = symbol_idx
+            self._name_idx = name_idx
+            return coins
+
+    def _fetch_coin_list(self) -> List[Dict[str, Any]]:
+        """
+        Fetch the coin list, stream-parsing when ijson is available.
+
+        The coins/list response is several MB; streaming it through ijson
+        keeps only the three fields we index (id, symbol, name) and avoids
+        materializing the whole body plus a full list of response dicts.
+        Falls back to the standard get() path when ijson is not installed
+        or the stream fails.
+
+        Returns:
+            List of slim coin dictionaries
+        """
+        if ijson is None:
+            return self.get("coins/list")
+
+        url = f"{self.base_url}/coins/list"
+        if self._bucket is not None:
+            self._bucket.acquire()
+        try:
+            response = self._session.get(url, timeout=self.timeout, stream=True)
+            if response.status_code >= 400:
+                raise APIError(
+                    f"HTTP error {response.status_code} from {url}",
+                    status_code=response.status_code,
+                    endpoint="coins/list",
+                )
+            with response:
+                response.raw.decode_content = True
+                return [
+                    {"id": c["id"], "symbol": c["symbol"], "name": c["name"]}
+                    for c in ijson.items(response.raw, "item")
+                ]
+        except (requests.exceptions.RequestException, ValueError):
+            return self.get("coins/list")
 
     def get_coin_data(self, coin_id: str) -> Dict[str, Any]:
         """
@@ -74,15 +198,42 @@ class CoinGeckoClient(BaseAPIClient):
         Returns:
             Coin data dictionary
         """
-        return self.get(
-            f"coins/{coin_id}",
-            params={
-                "localization": "false",
-                "tickers": "false",
-                "community_data": "true",
-                "developer_data": "false",
-                "sparkline": "false",
-            },
+        return self._response_cache.get_or_fetch(
+            f"coin_data_{coin_id}",
+            lambda: self.get(f"coins/{coin_id}", params=_COIN_DATA_PARAMS),
+        )
+
+    def get_simple_price(
+        self, coin_ids: List[str], vs_currency: str = "usd"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get scalar market fields for several coins in one request.
+
+        The simple/price endpoint returns price, market cap, 24h volume and
+        24h change for a comma-joined list of ids - a fraction of the bytes
+        of one full coins/{id} document per coin.
+
+        Args:
+            coin_ids: CoinGecko coin IDs
+            vs_currency: Target currency (default: usd)
+
+        Returns:
+            Mapping of coin ID to its scalar market fields
+        """
+        ids = ",".join(sorted(coin_ids))
+        return self._response_cache.get_or_fetch(
+            f"simple_price_{ids}_{vs_currency}",
+            lambda: self.get(
+                "simple/price",
+                params={
+                    "ids": ids,
+                    "vs_currencies": vs_currency,
+                    "include_market_cap": "true",
+                    "include_24hr_vol": "true",
+                    "include_24hr_change": "true",
+                },
+            ),
+            ttl=60,
         )
 
     def get_market_chart(
@@ -99,11 +250,29 @@ class CoinGeckoClient(BaseAPIClient):
         Returns:
             Market chart data
         """
-        return self.get(
-            f"coins/{coin_id}/market_chart",
-            params={
-                "vs_currency": vs_currency,
-                "days": days,
-                "interval": "daily" if days > 1 else "hourly",
-            },
+        return self._response_cache.get_or_fetch(
+            f"market_chart_{coin_id}_{days}_{vs_currency}",
+            lambda: self.get(
+                f"coins/{coin_id}/market_chart",
+                params={
+                    "vs_currency": vs_currency,
+                    "days": days,
+                    "interval": "daily" if days > 1 else "hourly",
+                },
+            ),
         )
+
+
+@lru_cache(maxsize=1)
+def get_client() -> CoinGeckoClient:
+    """
+    Get the shared process-wide CoinGecko client.
+
+    Every repository reusing one instance means one connection pool, one
+    memoized coin list and one response cache, instead of each
+    constructing their own.
+
+    Returns:
+        Shared CoinGeckoClient instance
+    """
+    return CoinGeckoClient()
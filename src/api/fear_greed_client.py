@@ -1,5 +1,6 @@
 """Fear & Greed Index API client."""
 
+from functools import lru_cache
 from typing import Dict, Any
 
 from src.api.base_client import BaseAPIClient
@@ -11,7 +12,11 @@ class FearGreedClient(BaseAPIClient):
 
     def __init__(self):
         """Initialize Fear & Greed client."""
-        super().__init__(FEAR_GREED_API_URL, service_name="Fear & Greed Index")
+        # No retries: get_fear_greed_index falls back to a neutral default on
+        # any failure, so paying backoff sleeps here is pure wasted latency
+        super().__init__(
+            FEAR_GREED_API_URL, max_retries=0, service_name="Fear & Greed Index"
+        )
 
     def get_fear_greed_index(self) -> Dict[str, Any]:
         """
@@ -40,3 +45,14 @@ class FearGreedClient(BaseAPIClient):
             "value_classification": "Neutral",
             "timestamp": None,
         }
+
+
+@lru_cache(maxsize=1)
+def get_client() -> FearGreedClient:
+    """
+    Get the shared process-wide Fear & Greed client.
+
+    Returns:
+        Shared FearGreedClient instance
+    """
+    return FearGreedClient()
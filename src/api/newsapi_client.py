@@ -1,18 +1,53 @@
 """NewsAPI client for fetching cryptocurrency news."""
 
-from typing import Dict, Any, List, Optional
+import itertools
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.api.base_client import ACCEPT_ENCODING
+from src.core.cache import Cache
 from src.core.exceptions import APIError
 from src.core.logging_config import get_logger
 from src.core.progress import get_progress_logger
-from src.config.constants import DEFAULT_TIMEOUT, NEWSAPI_BASE_URL
+from src.config.constants import (
+    DEFAULT_TIMEOUT,
+    NEWSAPI_BASE_URL,
+    RATE_LIMIT_CACHE_TTL,
+)
 
 logger = get_logger(__name__)
 progress = get_progress_logger()
 
 
+@lru_cache(maxsize=8)
+def _date_window(days_back: int, day_bucket: int) -> Tuple[str, str]:
+    """
+    Compute the (from, to) date strings for a search window.
+
+    Memoized on (days_back, day_bucket); the day bucket changes once per day,
+    so repeated searches share one formatted window instead of re-running
+    datetime.now() and strftime per call.
+
+    Args:
+        days_back: Number of days to look back
+        day_bucket: Current day number (time.time() // 86400)
+
+    Returns:
+        Tuple of (from_date, to_date) as YYYY-MM-DD strings
+    """
+    to_date = datetime.now()
+    from_date = to_date - timedelta(days=days_back)
+    return from_date.strftime("%Y-%m-%d"), to_date.strftime("%Y-%m-%d")
+
+
 class NewsAPIClient:
     """Client for NewsAPI to fetch cryptocurrency news articles."""
 
@@ -25,23 +60,33 @@ class NewsAPIClient:
         """
         self.api_key = api_key
         self.timeout = DEFAULT_TIMEOUT
-
-    def _get_headers(self) -> Dict[str, str]:
-        """
-        Get request headers with API key.
-
-        Returns:
-            Headers dictionary
-
-        Raises:
-            APIError: If API key is not configured
-        """
-        if not self.api_key:
-            raise APIError(
-                "NewsAPI key is not configured. Please set NEWSAPI_KEY environment variable.",
-                endpoint="newsapi",
-            )
-        return {"X-Api-Key": self.api_key}
+        # Memoize search results so repeated lookups for the same coin in a
+        # session don't burn the metered NewsAPI quota
+        self._cache = Cache(default_ttl=RATE_LIMIT_CACHE_TTL)
+
+        # Pooled session with the API key header set once, so each request
+        # reuses the TLS connection and skips per-call header construction
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10, pool_maxsize=20, pool_block=False
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(
+            {"Accept-Encoding": ACCEPT_ENCODING, "Connection": "keep-alive"}
+        )
+        if api_key:
+            self._session.headers.update({"X-Api-Key": api_key})
+
+    def close(self) -> None:
+        """Release the underlying connection pool."""
+        self._session.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def search_news(
         self,
@@ -70,25 +115,29 @@ class NewsAPIClient:
         if not self.api_key:
             return []
 
-        # Calculate date range
-        to_date = datetime.now()
-        from_date = to_date - timedelta(days=days_back)
+        # Calculate date range (memoized per day)
+        day_bucket = int(time.time() // 86400)
+        from_str, to_str = _date_window(days_back, day_bucket)
+
+        cache_key = f"search_{query}_{language}_{sort_by}_{page_size}_{days_back}_{day_bucket}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            progress.cache(f"Using cached news results for '{query}'")
+            return cached
 
         params = {
             "q": query,
             "language": language,
             "sortBy": sort_by,
             "pageSize": min(page_size, 100),  # NewsAPI max is 100
-            "from": from_date.strftime("%Y-%m-%d"),
-            "to": to_date.strftime("%Y-%m-%d"),
+            "from": from_str,
+            "to": to_str,
         }
 
         try:
             progress.api_call("NewsAPI", "Fetching news from")
             url = f"{NEWSAPI_BASE_URL}/everything"
-            response = requests.get(
-                url, params=params, headers=self._get_headers(), timeout=self.timeout
-            )
+            response = self._session.get(url, params=params, timeout=self.timeout)
 
             if response.status_code == 401:
                 raise APIError(
@@ -107,7 +156,10 @@ class NewsAPIClient:
                 )
 
             response.raise_for_status()
-            data = response.json()
+            if orjson is not None:
+                data = orjson.loads(response.content)
+            else:
+                data = response.json()
 
             if data.get("status") != "ok":
                 error_message = data.get("message", "Unknown error from NewsAPI")
@@ -115,15 +167,22 @@ class NewsAPIClient:
                 return []
 
             articles = data.get("articles", [])
-            # Filter out articles without title or description
-            filtered_articles = [
-                article
-                for article in articles
-                if article.get("title") and article.get("title") != "[Removed]"
-            ]
+            # Filter out articles without a usable title, stopping as soon as
+            # page_size articles are collected instead of filtering them all
+            result = list(
+                itertools.islice(
+                    (
+                        article
+                        for article in articles
+                        if (title := article.get("title")) and title != "[Removed]"
+                    ),
+                    page_size,
+                )
+            )
 
-            progress.success(f"Found {len(filtered_articles)} news articles")
-            return filtered_articles[:page_size]
+            progress.success(f"Found {len(result)} news articles")
+            self._cache.set(cache_key, result)
+            return result
 
         except requests.exceptions.Timeout:
             progress.warning("NewsAPI request timed out")
@@ -163,29 +222,28 @@ class NewsAPIClient:
         if not self.api_key:
             return []
 
-        # Try multiple search queries
-        queries = [coin_name]
+        # A single OR query returns the union the old name/symbol/combined
+        # queries produced, in one round trip instead of up to three
         if coin_symbol:
-            queries.append(coin_symbol)
-            queries.append(f"{coin_name} {coin_symbol}")
+            query = f'"{coin_name}" OR {coin_symbol}'
+        else:
+            query = coin_name
+
+        try:
+            articles = self.search_news(
+                query, page_size=min(page_size * 2, 100), days_back=7
+            )
+        except APIError:
+            return []
 
         all_articles = []
         seen_urls = set()
-
-        for query in queries:
-            try:
-                articles = self.search_news(query, page_size=page_size, days_back=7)
-                for article in articles:
-                    url = article.get("url")
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        all_articles.append(article)
-                        if len(all_articles) >= page_size:
-                            break
+        for article in articles:
+            url = article.get("url")
+            if url and url not in seen_urls:
+                seen_urls.add(url)
+                all_articles.append(article)
                 if len(all_articles) >= page_size:
                     break
-            except APIError:
-                # Continue with next query if one fails
-                continue
 
-        return all_articles[:page_size]
+        return all_articles
@@ -6,6 +6,8 @@ from src.config.constants import (
     DEFAULT_TIMEOUT,
     COINGECKO_BASE_URL,
     FEAR_GREED_API_URL,
+    COIN_SYMBOL_MAPPINGS,
+    COIN_ID_TO_SYMBOL,
 )
 
 __all__ = [
@@ -15,4 +17,6 @@ __all__ = [
     "DEFAULT_TIMEOUT",
     "COINGECKO_BASE_URL",
     "FEAR_GREED_API_URL",
+    "COIN_SYMBOL_MAPPINGS",
+    "COIN_ID_TO_SYMBOL",
 ]
@@ -1,5 +1,7 @@
 """Application constants."""
 
+from types import MappingProxyType
+
 # API Configuration
 COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
 FEAR_GREED_API_URL = "https://api.alternative.me/fng/"
@@ -13,8 +15,8 @@ RATE_LIMIT_CACHE_TTL = 600  # 10 minutes when rate limited
 # Request Configuration
 DEFAULT_TIMEOUT = 10  # seconds
 
-# Common Coin Symbol Mappings
-COIN_SYMBOL_MAPPINGS = {
+# Common Coin Symbol Mappings (read-only; checked on every coin lookup)
+COIN_SYMBOL_MAPPINGS = MappingProxyType({
     "btc": "bitcoin",
     "eth": "ethereum",
     "usdt": "tether",
@@ -30,7 +32,12 @@ COIN_SYMBOL_MAPPINGS = {
     "link": "chainlink",
     "uni": "uniswap",
     "atom": "cosmos",
-}
+})
+
+# Reverse map for coin-id -> symbol lookups
+COIN_ID_TO_SYMBOL = MappingProxyType(
+    {coin_id: symbol for symbol, coin_id in COIN_SYMBOL_MAPPINGS.items()}
+)
 
 # Analysis Types
 ANALYSIS_TYPES = ["fundamental", "price", "sentiment", "technical"]
@@ -1,16 +1,48 @@
 """Application settings management."""
 
 import os
+import sys
+from functools import lru_cache
 from typing import Optional
 from dataclasses import dataclass
 
 from src.core.exceptions import ConfigurationError
 from src.core.logging_config import get_logger
 
-logger = get_logger(__name__)
+# The logger is only consulted on warning branches, so it is bound lazily
+# there instead of at import time
 
+# Known-good model names; frozenset gives O(1) membership without rebuilding
+# the collection on every validation
+_VALID_MODELS = frozenset(
+    {"gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-4o-mini", "gpt-3.5-turbo"}
+)
+_VALID_MODELS_STR = ", ".join(sorted(_VALID_MODELS))
 
-@dataclass
+# Accepted truthy spellings for boolean env vars
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+# Integer env vars as (key, default, strict); strict fields raise
+# ConfigurationError on a bad value, lenient ones fall back to the default
+_INT_FIELDS = (
+    ("CACHE_TTL", 300, True),
+    ("REQUEST_TIMEOUT", 10, True),
+    ("SEMANTIC_CACHE_SIZE", 1000, False),
+    ("SEMANTIC_CACHE_TTL", 3600, False),
+)
+
+
+def _envbool(env, key: str, default: str) -> bool:
+    """Parse a boolean environment variable against the shared truthy set."""
+    return env.get(key, default).lower() in _TRUTHY
+
+
+# slots=True drops the per-instance __dict__ for smaller objects and faster
+# attribute access, but the keyword only exists on Python >= 3.10; older
+# interpreters (the documented floor is 3.8) get a plain dataclass. Not
+# frozen: the CLI downgrades openai_model in place when GPT-4 access is
+# unavailable.
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class Settings:
     """Application settings with validation."""
 
@@ -42,21 +74,16 @@ class Settings:
             )
 
         if not self.openai_api_key.startswith("sk-"):
-            logger.warning(
+            get_logger(__name__).warning(
                 "OpenAI API key doesn't start with 'sk-'. Please verify it's correct."
             )
 
-        valid_models = [
-            "gpt-4",
-            "gpt-4-turbo",
-            "gpt-4o",
-            "gpt-4o-mini",
-            "gpt-3.5-turbo",
-        ]
-        if self.openai_model not in valid_models:
-            logger.warning(
-                f"Model '{self.openai_model}' may not be valid. "
-                f"Valid models: {', '.join(valid_models)}"
+        if self.openai_model not in _VALID_MODELS:
+            # %-style args defer formatting until the logger accepts the record
+            get_logger(__name__).warning(
+                "Model '%s' may not be valid. Valid models: %s",
+                self.openai_model,
+                _VALID_MODELS_STR,
             )
 
         if self.cache_ttl < 0:
@@ -72,7 +99,7 @@ class Settings:
             )
 
         if self.langsmith_enabled and not self.langsmith_api_key:
-            logger.warning(
+            get_logger(__name__).warning(
                 "LangSmith is enabled but API key is not provided. Tracing will be disabled."
             )
 
@@ -87,80 +114,69 @@ class Settings:
         Raises:
             ConfigurationError: If required environment variables are missing or invalid
         """
-        openai_api_key = os.getenv("OPENAI_API_KEY")
+        # Read through a single environ reference; each lookup below is a
+        # direct dict probe, and raw values are kept so error paths don't
+        # re-read the variable
+        env = os.environ
+
+        openai_api_key = env.get("OPENAI_API_KEY")
         if not openai_api_key:
             raise ConfigurationError(
                 "OPENAI_API_KEY environment variable is required",
                 config_key="OPENAI_API_KEY",
             )
 
-        try:
-            cache_ttl = int(os.getenv("CACHE_TTL", "300"))
-        except ValueError as e:
-            raise ConfigurationError(
-                f"Invalid CACHE_TTL value: {os.getenv('CACHE_TTL')}",
-                config_key="CACHE_TTL",
-            ) from e
-
-        try:
-            request_timeout = int(os.getenv("REQUEST_TIMEOUT", "10"))
-        except ValueError as e:
-            raise ConfigurationError(
-                f"Invalid REQUEST_TIMEOUT value: {os.getenv('REQUEST_TIMEOUT')}",
-                config_key="REQUEST_TIMEOUT",
-            ) from e
-
-        verbose_str = os.getenv("VERBOSE", "true").lower()
-        verbose = verbose_str in ("true", "1", "yes", "on")
-
-        newsapi_key = os.getenv("NEWSAPI_KEY", "").strip()
+        int_values = {}
+        for key, default, strict in _INT_FIELDS:
+            raw = env.get(key)
+            if raw is None:
+                int_values[key] = default
+                continue
+            try:
+                int_values[key] = int(raw)
+            except ValueError as e:
+                if strict:
+                    raise ConfigurationError(
+                        f"Invalid {key} value: {raw}", config_key=key
+                    ) from e
+                int_values[key] = default
+
+        verbose = _envbool(env, "VERBOSE", "true")
+
+        newsapi_key = env.get("NEWSAPI_KEY", "").strip()
         newsapi_key = newsapi_key if newsapi_key else None
 
-        semantic_cache_enabled = os.getenv(
-            "SEMANTIC_CACHE_ENABLED", "true"
-        ).lower() in ("true", "1", "yes")
+        semantic_cache_enabled = _envbool(env, "SEMANTIC_CACHE_ENABLED", "true")
 
         try:
             semantic_cache_threshold = float(
-                os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.85")
+                env.get("SEMANTIC_CACHE_THRESHOLD", "0.85")
             )
         except ValueError:
             semantic_cache_threshold = 0.85
 
-        try:
-            semantic_cache_size = int(os.getenv("SEMANTIC_CACHE_SIZE", "1000"))
-        except ValueError:
-            semantic_cache_size = 1000
-
-        try:
-            semantic_cache_ttl = int(os.getenv("SEMANTIC_CACHE_TTL", "3600"))
-        except ValueError:
-            semantic_cache_ttl = 3600
-
-        semantic_cache_file = os.getenv("SEMANTIC_CACHE_FILE", "").strip()
+        semantic_cache_file = env.get("SEMANTIC_CACHE_FILE", "").strip()
         semantic_cache_file = semantic_cache_file if semantic_cache_file else None
 
-        langsmith_enabled = os.getenv("LANGSMITH_ENABLED", "false").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
-        langsmith_api_key = os.getenv("LANGSMITH_API_KEY", "").strip()
+        langsmith_enabled = _envbool(env, "LANGSMITH_ENABLED", "false")
+        langsmith_api_key = env.get("LANGSMITH_API_KEY", "").strip()
         langsmith_api_key = langsmith_api_key if langsmith_api_key else None
-        langsmith_project = os.getenv("LANGSMITH_PROJECT", "").strip()
+        langsmith_project = env.get("LANGSMITH_PROJECT", "").strip()
         langsmith_project = langsmith_project if langsmith_project else None
 
+        # Interning lets downstream equality checks and dict lookups on these
+        # strings short-circuit to pointer comparison
         settings = cls(
-            openai_api_key=openai_api_key.strip(),
-            openai_model=os.getenv("OPENAI_MODEL", "gpt-4o-mini").strip(),
-            cache_ttl=cache_ttl,
-            request_timeout=request_timeout,
+            openai_api_key=sys.intern(openai_api_key.strip()),
+            openai_model=sys.intern(env.get("OPENAI_MODEL", "gpt-4o-mini").strip()),
+            cache_ttl=int_values["CACHE_TTL"],
+            request_timeout=int_values["REQUEST_TIMEOUT"],
             verbose=verbose,
             newsapi_key=newsapi_key,
             semantic_cache_enabled=semantic_cache_enabled,
             semantic_cache_threshold=semantic_cache_threshold,
-            semantic_cache_size=semantic_cache_size,
-            semantic_cache_ttl=semantic_cache_ttl,
+            semantic_cache_size=int_values["SEMANTIC_CACHE_SIZE"],
+            semantic_cache_ttl=int_values["SEMANTIC_CACHE_TTL"],
             semantic_cache_file=semantic_cache_file,
             langsmith_enabled=langsmith_enabled,
             langsmith_api_key=langsmith_api_key,
@@ -171,20 +187,18 @@ class Settings:
         return settings
 
 
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get application settings (singleton pattern).
 
+    Cached after the first call; use ``get_settings.cache_clear()`` to force
+    a reload from the environment.
+
     Returns:
         Settings instance
 
     Raises:
         ConfigurationError: If settings cannot be loaded
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings.from_env()
-    return _settings
+    return Settings.from_env()
@@ -1,21 +1,55 @@
 """Caching utilities."""
 
+import json
+import os
+import sqlite3
+import threading
 import time
-from typing import Any, Callable, Optional, Dict, Tuple
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+# Every SWEEP_INTERVAL-th set() pops up to SWEEP_BATCH expired entries so
+# long-lived caches don't accumulate stale keys between reads
+_SWEEP_INTERVAL = 64
+_SWEEP_BATCH = 8
+
+# Sentinel stored for fetches that returned None, so "not found" upstream
+# answers are remembered briefly instead of refetched on every call
+_MISS = object()
 
 
 class Cache:
-    """Simple in-memory cache with TTL support."""
+    """Simple in-memory LRU cache with TTL support and bounded size."""
 
-    def __init__(self, default_ttl: int = 300):
+    def __init__(
+        self, default_ttl: int = 300, max_size: int = 1024, negative_ttl: int = 30
+    ):
         """
         Initialize cache.
 
         Args:
             default_ttl: Default time-to-live in seconds (default: 300 = 5 minutes)
+            max_size: Maximum number of entries before LRU eviction (default: 1024)
+            negative_ttl: Time-to-live for cached "not found" results (default: 30)
         """
-        self._cache: Dict[str, Tuple[Any, float]] = {}
+        # Values and monotonic deadlines live in parallel dicts instead of
+        # per-entry tuples: no 2-tuple allocation per set(), and expiry
+        # sweeps scan the deadline dict without touching the values. The
+        # value dict's insertion order doubles as recency order for LRU.
+        self._values: "OrderedDict[str, Any]" = OrderedDict()
+        self._deadlines: dict = {}
+        # Guards the two storage dicts: the parallel analysis threads and
+        # background refreshes mean a probe and the read behind it must not
+        # interleave with an eviction or sweep on another thread
+        self._lock = threading.Lock()
         self.default_ttl = default_ttl
+        self.max_size = max_size
+        self.negative_ttl = negative_ttl
+        self._sweep_counter = 0
+        # Singleflight bookkeeping: one fetch per key at a time, concurrent
+        # callers wait for the leader's result instead of duplicating it
+        self._inflight: dict = {}
+        self._inflight_lock = threading.Lock()
 
     def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
         """
@@ -28,19 +62,236 @@ class Cache:
         Returns:
             Cached value or None if not found or expired
         """
-        if key not in self._cache:
-            return None
+        with self._lock:
+            deadline = self._deadlines.get(key)
+            if deadline is None:
+                return None
+
+            if time.monotonic() >= deadline:
+                if allow_stale:
+                    value = self._values[key]
+                    return None if value is _MISS else value
+                del self._values[key]
+                del self._deadlines[key]
+                return None
+
+            self._values.move_to_end(key)
+            value = self._values[key]
+            return None if value is _MISS else value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store value in cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds (uses default if None)
+        """
+        ttl = ttl if ttl is not None else self.default_ttl
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            self._deadlines[key] = time.monotonic() + ttl
+
+            while len(self._values) > self.max_size:
+                evicted, _ = self._values.popitem(last=False)
+                del self._deadlines[evicted]
+
+            self._sweep_counter += 1
+            if self._sweep_counter >= _SWEEP_INTERVAL:
+                self._sweep_counter = 0
+                self._sweep_expired()
+
+    def _sweep_expired(self) -> None:
+        """Drop a batch of the oldest entries if they have expired.
+
+        Caller must hold ``_lock``.
+        """
+        now = time.monotonic()
+        for _ in range(_SWEEP_BATCH):
+            if not self._values:
+                return
+            oldest_key = next(iter(self._values))
+            if self._deadlines[oldest_key] > now:
+                return
+            del self._values[oldest_key]
+            del self._deadlines[oldest_key]
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch_func: Callable[[], Any],
+        ttl: Optional[int] = None,
+        refresh_ahead: bool = False,
+    ) -> Any:
+        """
+        Get from cache or fetch and cache the result.
+
+        Concurrent misses on the same key are collapsed into a single fetch;
+        the other callers wait for the leader's result.
 
-        value, timestamp = self._cache[key]
-        age = time.time() - timestamp
+        With refresh_ahead, a hit in the second half of its TTL is served
+        immediately while a background thread refreshes the entry, so hot
+        keys are revalidated without any caller waiting on the API.
 
-        if age >= self.default_ttl:
-            if allow_stale:
+        Args:
+            key: Cache key
+            fetch_func: Function to fetch data if not cached
+            ttl: Time-to-live in seconds (uses default if None)
+            refresh_ahead: Refresh aging hits in the background
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        while True:
+            # Probe storage directly so a fresh negative entry counts as a
+            # hit (returning None) instead of triggering a refetch
+            with self._lock:
+                deadline = self._deadlines.get(key)
+                hit = deadline is not None and time.monotonic() < deadline
+                if hit:
+                    self._values.move_to_end(key)
+                    value = self._values[key]
+            if hit:
+                if refresh_ahead and value is not _MISS:
+                    effective_ttl = ttl if ttl is not None else self.default_ttl
+                    if time.monotonic() >= deadline - effective_ttl / 2:
+                        self._refresh_in_background(key, fetch_func, ttl)
+                return None if value is _MISS else value
+
+            with self._inflight_lock:
+                event = self._inflight.get(key)
+                if event is None:
+                    event = self._inflight[key] = threading.Event()
+                    leader = True
+                else:
+                    leader = False
+
+            if not leader:
+                # Wait for the in-flight fetch, then re-read the cache; if
+                # the leader failed, loop around and take over the fetch
+                event.wait()
+                continue
+
+            try:
+                value = fetch_func()
+                if value is None:
+                    self.set(key, _MISS, self.negative_ttl)
+                    return None
+                self.set(key, value, ttl)
                 return value
-            del self._cache[key]
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[key]
+                event.set()
+
+    def _refresh_in_background(
+        self, key: str, fetch_func: Callable[[], Any], ttl: Optional[int]
+    ) -> None:
+        """Refresh an aging entry on a daemon thread, at most once at a time.
+
+        Registering in the inflight map keeps concurrent callers from
+        stacking refresh threads for the same key. Failures are swallowed:
+        the entry is still fresh, and the next aging hit retries.
+        """
+        with self._inflight_lock:
+            if key in self._inflight:
+                return
+            event = self._inflight[key] = threading.Event()
+
+        def refresh() -> None:
+            try:
+                value = fetch_func()
+                if value is not None:
+                    self.set(key, value, ttl)
+            except Exception:
+                pass
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[key]
+                event.set()
+
+        threading.Thread(
+            target=refresh, name=f"cache-refresh-{key}", daemon=True
+        ).start()
+
+    def clear(self) -> None:
+        """Clear all cached values."""
+        with self._lock:
+            self._values.clear()
+            self._deadlines.clear()
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a specific key from cache.
+
+        Args:
+            key: Cache key to remove
+        """
+        with self._lock:
+            self._values.pop(key, None)
+            self._deadlines.pop(key, None)
+
+
+class PersistentCache:
+    """Disk-backed cache for slow-changing data that should survive restarts.
+
+    Values must be JSON-serializable; entries that are not are silently
+    skipped. Deadlines use wall-clock time since they outlive the process.
+    """
+
+    def __init__(self, path: Optional[str] = None, default_ttl: int = 86400):
+        """
+        Initialize persistent cache.
+
+        Args:
+            path: SQLite file path (default: ~/.cache/crypto-agent/cache.db)
+            default_ttl: Default time-to-live in seconds (default: 24 hours)
+        """
+        if path is None:
+            path = os.path.join(
+                os.path.expanduser("~"), ".cache", "crypto-agent", "cache.db"
+            )
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self.default_ttl = default_ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache if not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found, expired, or unreadable
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
             return None
 
-        return value
+        value, expires_at = row
+        if time.time() >= expires_at:
+            self.invalidate(key)
+            return None
+
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
@@ -48,11 +299,26 @@ class Cache:
 
         Args:
             key: Cache key
-            value: Value to cache
+            value: JSON-serializable value to cache
             ttl: Time-to-live in seconds (uses default if None)
         """
-        ttl = ttl or self.default_ttl
-        self._cache[key] = (value, time.time())
+        ttl = ttl if ttl is not None else self.default_ttl
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError):
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, payload, time.time() + ttl),
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            # A read-only or corrupt cache file degrades to a miss, it
+            # must never take the caller down
+            pass
 
     def get_or_fetch(
         self, key: str, fetch_func: Callable[[], Any], ttl: Optional[int] = None
@@ -76,10 +342,6 @@ class Cache:
         self.set(key, value, ttl)
         return value
 
-    def clear(self) -> None:
-        """Clear all cached values."""
-        self._cache.clear()
-
     def invalidate(self, key: str) -> None:
         """
         Remove a specific key from cache.
@@ -87,5 +349,22 @@ class Cache:
         Args:
             key: Cache key to remove
         """
-        if key in self._cache:
-            del self._cache[key]
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        """Clear all cached values."""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache")
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -1,9 +1,29 @@
 """Progress logging utility for clean, user-friendly progress messages."""
 
+import atexit
 import sys
 import os
 from typing import Optional
 
+# Flush at most every N messages when output is not interactive
+_FLUSH_EVERY = 16
+
+
+def _flush_stdout() -> None:
+    """Flush any batched progress output at interpreter exit."""
+    try:
+        sys.stdout.flush()
+    except (ValueError, OSError):
+        pass
+
+
+atexit.register(_flush_stdout)
+
+
+def _noop(*args, **kwargs) -> None:
+    """Shared no-op bound in place of logging methods when disabled."""
+    return None
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -30,15 +50,22 @@ class Colors:
     BRIGHT_WHITE = "\033[97m"
 
 
-def _supports_color() -> bool:
-    """Check if the terminal supports color output."""
-    if not hasattr(sys.stdout, "isatty") or not sys.stdout.isatty():
-        return False
+_color_supported: Optional[bool] = None
 
-    if os.name == "nt":
-        return os.getenv("TERM") != "dumb" or os.getenv("ANSICON") is not None
 
-    return True
+def _supports_color() -> bool:
+    """Check if the terminal supports color output (cached after first call)."""
+    global _color_supported
+    if _color_supported is None:
+        if not hasattr(sys.stdout, "isatty") or not sys.stdout.isatty():
+            _color_supported = False
+        elif os.name == "nt":
+            _color_supported = (
+                os.getenv("TERM") != "dumb" or os.getenv("ANSICON") is not None
+            )
+        else:
+            _color_supported = True
+    return _color_supported
 
 
 class ProgressLogger:
@@ -55,34 +82,58 @@ class ProgressLogger:
         self.enabled = enabled
         self.use_colors = use_colors if use_colors is not None else _supports_color()
 
-    def _print(
-        self, message: str, prefix: str = "", color: Optional[str] = None
-    ) -> None:
+        # When disabled, swap every logging method for a shared no-op so
+        # call sites pay one C-level call instead of formatting and an
+        # enabled-flag branch per message
+        if not enabled:
+            self.api_call = _noop
+            self.success = _noop
+            self.info = _noop
+            self.warning = _noop
+            self.error = _noop
+            self.cache = _noop
+
+        # Precompute one template per message level so the hot logging
+        # methods do a single str.format and write, with no per-call
+        # color-branching or repeated concatenation
+        if self.use_colors:
+            self._tmpl_api = f"{Colors.BRIGHT_CYAN}{{}}{Colors.RESET}\n"
+            self._tmpl_success = f"{Colors.BRIGHT_GREEN}{{}}{Colors.RESET}\n"
+            self._tmpl_info = f"{Colors.BRIGHT_BLUE}{{}}{Colors.RESET}\n"
+            self._tmpl_warning = f"{Colors.BRIGHT_YELLOW}{{}}{Colors.RESET}\n"
+            self._tmpl_error = f"{Colors.BRIGHT_RED}{{}}{Colors.RESET}\n"
+        else:
+            self._tmpl_api = "{}\n"
+            self._tmpl_success = "{}\n"
+            self._tmpl_info = "{}\n"
+            self._tmpl_warning = "{}\n"
+            self._tmpl_error = "{}\n"
+
+        # On a terminal every message flushes for immediate feedback; when
+        # output is piped or redirected, batch flushes to cut write syscalls
+        self._batch = not (
+            hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
+        )
+        self._pending = 0
+
+    def _write(self, template: str, message: str, urgent: bool = False) -> None:
         """
-        Print a progress message with optional color.
+        Write a formatted message to stdout.
 
         Args:
-            message: Message to print
-            prefix: Prefix symbol
-            color: ANSI color code
+            template: Precomputed per-level template
+            message: Message to interpolate
+            urgent: Flush immediately regardless of batching (warnings/errors)
         """
         if not self.enabled:
             return
-
-        if self.use_colors and color:
-            if prefix:
-                print(
-                    f"{color}{prefix}{Colors.RESET} {color}{message}{Colors.RESET}",
-                    file=sys.stdout,
-                    flush=True,
-                )
-            else:
-                print(f"{color}{message}{Colors.RESET}", file=sys.stdout, flush=True)
-        else:
-            if prefix:
-                print(f"{prefix} {message}", file=sys.stdout, flush=True)
-            else:
-                print(message, file=sys.stdout, flush=True)
+        sys.stdout.write(template.format(message))
+        if self._batch and not urgent:
+            self._pending += 1
+            if self._pending < _FLUSH_EVERY:
+                return
+        self._pending = 0
+        sys.stdout.flush()
 
     def api_call(self, service: str, action: str = "calling") -> None:
         """
@@ -92,7 +143,7 @@ class ProgressLogger:
             service: Name of the API service (e.g., "CoinGecko", "NewsAPI")
             action: Action being performed (default: "calling")
         """
-        self._print(f"{action} {service} API...", prefix="", color=Colors.BRIGHT_CYAN)
+        self._write(self._tmpl_api, f"{action} {service} API...")
 
     def success(self, message: str) -> None:
         """
@@ -101,7 +152,7 @@ class ProgressLogger:
         Args:
             message: Success message
         """
-        self._print(message, prefix="", color=Colors.BRIGHT_GREEN)
+        self._write(self._tmpl_success, message)
 
     def info(self, message: str) -> None:
         """
@@ -110,7 +161,7 @@ class ProgressLogger:
         Args:
             message: Info message
         """
-        self._print(message, prefix="", color=Colors.BRIGHT_BLUE)
+        self._write(self._tmpl_info, message)
 
     def warning(self, message: str) -> None:
         """
@@ -119,7 +170,7 @@ class ProgressLogger:
         Args:
             message: Warning message
         """
-        self._print(message, prefix="", color=Colors.BRIGHT_YELLOW)
+        self._write(self._tmpl_warning, message, urgent=True)
 
     def error(self, message: str) -> None:
         """
@@ -128,7 +179,7 @@ class ProgressLogger:
         Args:
             message: Error message
         """
-        self._print(message, prefix="", color=Colors.BRIGHT_RED)
+        self._write(self._tmpl_error, message, urgent=True)
 
     def cache(self, message: str) -> None:
         """
@@ -137,7 +188,7 @@ class ProgressLogger:
         Args:
             message: Cache message
         """
-        self._print(message, prefix="", color=Colors.BRIGHT_RED)
+        self._write(self._tmpl_error, message)
 
 
 # Global progress logger instance
@@ -1,18 +1,64 @@
 """Semantic cache for LLM responses using embedding similarity."""
 
+import atexit
+import heapq
+import queue
+import re
+import threading
 import time
 import hashlib
 import json
 import logging
 from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from openai import OpenAI
 import numpy as np
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Persist after this many inserts or this many seconds, whichever first
+_SAVE_EVERY = 16
+_SAVE_INTERVAL = 30.0
+
+# Responses containing any of these phrases are transient failures and must
+# not be cached; one precompiled alternation scans the response in a single
+# pass instead of one substring search per phrase
+_ERROR_PATTERNS = (
+    "i encountered an error",
+    "i apologize, but i couldn't generate",
+    "api error",
+    "rate limit exceeded",
+    "could not find cryptocurrency",
+    "error in",
+    "an unexpected error occurred",
+    "please try again",
+    "please wait",
+    "temporarily unavailable",
+    "failed to",
+    "unable to",
+    "couldn't",
+    "could not",
+    "error occurred",
+    "encountered an error",
+)
+_ERROR_PATTERNS_RE = re.compile(
+    "|".join(re.escape(p) for p in _ERROR_PATTERNS), re.IGNORECASE
+)
+
+
+def _normalize(vec: np.ndarray) -> np.ndarray:
+    """L2-normalize a vector, leaving zero vectors unchanged."""
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm > 0 else vec
+
 
 @dataclass
 class CachedResponse:
@@ -64,52 +110,164 @@ class SemanticCache:
         else:
             project_root = Path(__file__).parent.parent.parent
             self.cache_file = project_root / "semantic_cache.json"
-
+        # Embeddings are persisted as raw float32 in a sidecar .npy file;
+        # the JSON keeps only the small textual metadata
+        self._embeddings_file = self.cache_file.with_suffix(".npy")
+
+        # Entries are insertion-ordered (oldest first) so eviction pops the
+        # front. Embeddings live in one contiguous float32 matrix of unit
+        # vectors so similarity search is a single matrix-vector product;
+        # key<->row maps plus a free-list make removal O(1) - freed rows are
+        # zeroed and reused by later inserts instead of shifting the matrix.
         self._cache: Dict[str, CachedResponse] = {}
-        self._embeddings: List[np.ndarray] = []
-        self._cache_keys: List[str] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._n = 0
+        self._key_to_row: Dict[str, int] = {}
+        self._row_to_key: Dict[int, str] = {}
+        self._free_rows: List[int] = []
+        # Min-heap of (expires_at, key) so cleanup only touches entries that
+        # are actually due instead of scanning the whole cache; stale heap
+        # items (entries removed by other paths) are skipped on pop
+        self._expiry_heap: List[Tuple[float, str]] = []
+
+        # Memoize embeddings per query text: a get() miss followed by set()
+        # for the same query costs one OpenAI round-trip, not two
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embedding_cache_size = 512
+
+        # Debounce persistence: rewriting the full JSON on every set is the
+        # dominant per-insert cost, so saves happen at most every
+        # _SAVE_EVERY inserts or _SAVE_INTERVAL seconds, with a final flush
+        # at exit
+        self._dirty = 0
+        self._last_save = time.monotonic()
 
         self._load_from_file()
         self._ensure_cache_file_exists()
 
+        # Disk writes happen on a daemon thread fed by a single-slot
+        # mailbox: set() never blocks on I/O, and a newer snapshot simply
+        # replaces an older one still waiting to be written
+        self._save_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=1)
+        self._save_thread = threading.Thread(
+            target=self._save_loop, daemon=True, name="semantic-cache-save"
+        )
+        self._save_thread.start()
+        atexit.register(self.flush)
+
     def _get_embedding(self, text: str) -> np.ndarray:
-        """Get embedding for text."""
+        """Get embedding for text, memoized per exact query string."""
+        cached = self._embedding_cache.get(text)
+        if cached is not None:
+            self._embedding_cache.move_to_end(text)
+            return cached
+
         try:
             response = self.client.embeddings.create(
                 model=self.embedding_model, input=[text]
             )
-            embedding = response.data[0].embedding
-            return np.array(embedding, dtype=np.float32)
+            embedding = np.array(response.data[0].embedding, dtype=np.float32)
         except Exception as e:
             raise RuntimeError(f"Failed to get embedding: {e}") from e
 
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors."""
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        return float(dot_product / (norm1 * norm2))
+        embedding = _normalize(embedding)
+        self._embedding_cache[text] = embedding
+        while len(self._embedding_cache) > self._embedding_cache_size:
+            self._embedding_cache.popitem(last=False)
+        return embedding
+
+    def _get_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Get embeddings for several texts in one API call.
+
+        Texts already in the memo cache are not refetched; the single
+        round-trip covers only the missing ones.
+
+        Args:
+            texts: Query strings to embed
+
+        Returns:
+            Unit-vector embeddings in the same order as texts
+        """
+        missing = [t for t in texts if t not in self._embedding_cache]
+        if missing:
+            try:
+                response = self.client.embeddings.create(
+                    model=self.embedding_model, input=missing
+                )
+            except Exception as e:
+                raise RuntimeError(f"Failed to get embeddings: {e}") from e
+
+            for text, item in zip(missing, response.data):
+                self._embedding_cache[text] = _normalize(
+                    np.array(item.embedding, dtype=np.float32)
+                )
+            while len(self._embedding_cache) > self._embedding_cache_size:
+                self._embedding_cache.popitem(last=False)
+
+        return [self._embedding_cache[t] for t in texts]
+
+    def warmup(self, queries: List[str]) -> None:
+        """
+        Preload embeddings for a list of queries with one batched API call.
+
+        Subsequent get/set calls for these exact queries skip the embedding
+        round-trip entirely.
+
+        Args:
+            queries: Query strings to embed ahead of time
+        """
+        if queries:
+            self._get_embeddings_batch(queries)
+
+    def _append_embedding(self, key: str, embedding: np.ndarray) -> None:
+        """Store a unit-vector embedding row for key, reusing freed rows."""
+        # Re-setting a live key overwrites its existing row in place;
+        # allocating a second row would leave the old one orphaned in
+        # _row_to_key and leak it on removal
+        row = self._key_to_row.get(key)
+        if row is not None:
+            self._matrix[row] = embedding
+            return
+
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            dim = embedding.shape[0]
+            if self._matrix is None:
+                self._matrix = np.empty((64, dim), dtype=np.float32)
+            elif self._n >= self._matrix.shape[0]:
+                capacity = self._matrix.shape[0] * 2
+                matrix = np.empty((capacity, dim), dtype=np.float32)
+                matrix[: self._n] = self._matrix[: self._n]
+                self._matrix = matrix
+            row = self._n
+            self._n += 1
+
+        self._matrix[row] = embedding
+        self._key_to_row[key] = row
+        self._row_to_key[row] = key
 
     def _find_similar_query(
         self, query_embedding: np.ndarray
     ) -> Optional[Tuple[str, CachedResponse, float]]:
         """Find most similar cached query."""
-        if not self._embeddings:
+        if self._n == 0:
             return None
 
-        best_similarity = 0.0
-        best_key = None
+        # Rows and query are unit vectors, so one BLAS matrix-vector product
+        # yields the cosine similarity of every cached embedding directly
+        scores = self._matrix[: self._n] @ query_embedding.astype(np.float32)
 
-        for i, cached_embedding in enumerate(self._embeddings):
-            similarity = self._cosine_similarity(query_embedding, cached_embedding)
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_key = self._cache_keys[i]
+        best_index = int(scores.argmax())
+        best_similarity = float(scores[best_index])
 
         if best_similarity >= self.similarity_threshold:
-            return (best_key, self._cache[best_key], best_similarity)
+            # Freed rows are zeroed, so they can only win argmax when every
+            # live score is non-positive - below any sane threshold
+            best_key = self._row_to_key.get(best_index)
+            if best_key is not None:
+                return (best_key, self._cache[best_key], best_similarity)
 
         return None
 
@@ -123,24 +281,28 @@ class SemanticCache:
         if len(self._cache) < self.max_cache_size:
             return
 
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].timestamp)
+        # Entries are inserted in timestamp order, so the first key is oldest
+        oldest_key = next(iter(self._cache))
         self._remove(oldest_key)
 
     def _remove(self, key: str) -> None:
         """Remove entry from cache."""
-        if key in self._cache:
-            index = self._cache_keys.index(key)
+        row = self._key_to_row.pop(key, None)
+        if row is not None:
             del self._cache[key]
-            del self._cache_keys[index]
-            del self._embeddings[index]
+            del self._row_to_key[row]
+            self._matrix[row] = 0.0
+            self._free_rows.append(row)
 
     def _cleanup_expired(self) -> None:
-        """Remove expired entries from cache."""
-        expired_keys = [
-            key for key, cached in self._cache.items() if self._is_expired(cached)
-        ]
-        for key in expired_keys:
-            self._remove(key)
+        """Remove entries whose expiry deadline has passed."""
+        now = time.time()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, key = heapq.heappop(heap)
+            cached = self._cache.get(key)
+            if cached is not None and cached.expires_at <= now:
+                self._remove(key)
 
     def get(self, query: str) -> Optional[str]:
         """Get cached response for similar query."""
@@ -170,38 +332,10 @@ class SemanticCache:
 
     def _is_valid_response(self, response: str) -> bool:
         """Check if response is valid and should be cached."""
-        if not response or not response.strip():
-            return False
-
-        response_lower = response.lower()
-
-        error_patterns = [
-            "i encountered an error",
-            "i apologize, but i couldn't generate",
-            "api error",
-            "rate limit exceeded",
-            "could not find cryptocurrency",
-            "error in",
-            "an unexpected error occurred",
-            "please try again",
-            "please wait",
-            "temporarily unavailable",
-            "failed to",
-            "unable to",
-            "couldn't",
-            "could not",
-            "error occurred",
-            "encountered an error",
-        ]
-
-        for pattern in error_patterns:
-            if pattern in response_lower:
-                return False
-
-        if len(response.strip()) < 20:
+        if not response or len(response.strip()) < 20:
             return False
 
-        return True
+        return _ERROR_PATTERNS_RE.search(response) is None
 
     def set(self, query: str, response: str) -> None:
         """Cache a query-response pair."""
@@ -213,36 +347,62 @@ class SemanticCache:
 
         try:
             query_embedding = self._get_embedding(query)
-            cache_key = hashlib.md5(query.encode()).hexdigest()
+            # Keys are internal identifiers, not checksums: a 64-bit blake2b
+            # digest is faster than md5 and half the characters on disk
+            cache_key = hashlib.blake2b(
+                query.encode("utf-8"), digest_size=8
+            ).hexdigest()
             current_time = time.time()
 
+            # The matrix is the authority for embeddings; the dataclass field
+            # stays empty to avoid holding a float list per entry
             cached_response = CachedResponse(
                 query=query,
                 response=response,
-                embedding=query_embedding.tolist(),
+                embedding=[],
                 timestamp=current_time,
                 expires_at=current_time + self.ttl,
             )
 
             self._cache[cache_key] = cached_response
-            self._cache_keys.append(cache_key)
-            self._embeddings.append(query_embedding)
+            self._append_embedding(cache_key, query_embedding)
+            heapq.heappush(
+                self._expiry_heap, (cached_response.expires_at, cache_key)
+            )
 
-            self._save_to_file()
+            self._dirty += 1
+            if (
+                self._dirty >= _SAVE_EVERY
+                or time.monotonic() - self._last_save >= _SAVE_INTERVAL
+            ):
+                self._save_to_file()
             logger.debug(f"Cached query-response pair: {query[:50]}...")
         except Exception as e:
             logger.warning(f"Failed to cache response: {e}", exc_info=True)
 
+    def flush(self) -> None:
+        """Persist any unsaved entries and wait for the write to finish."""
+        if self._dirty:
+            self._save_to_file()
+        self._save_queue.join()
+
     def clear(self) -> None:
         """Clear all cached responses."""
         self._cache.clear()
-        self._embeddings.clear()
-        self._cache_keys.clear()
-        if self.cache_file.exists():
-            try:
-                self.cache_file.unlink()
-            except Exception:
-                pass
+        self._dirty = 0
+        self._matrix = None
+        self._n = 0
+        self._key_to_row.clear()
+        self._row_to_key.clear()
+        self._free_rows.clear()
+        self._expiry_heap.clear()
+        self._embedding_cache.clear()
+        for path in (self.cache_file, self._embeddings_file):
+            if path.exists():
+                try:
+                    path.unlink()
+                except Exception:
+                    pass
 
     def _load_from_file(self) -> None:
         """Load cache from JSON file."""
@@ -250,14 +410,29 @@ class SemanticCache:
             return
 
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if orjson is not None:
+                data = orjson.loads(self.cache_file.read_bytes())
+            else:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
 
             if not isinstance(data, dict) or "entries" not in data:
                 return
 
+            entries = data.get("entries", [])
+
+            # Embeddings come from the binary sidecar (current format) or
+            # inline JSON floats (legacy files)
+            matrix = None
+            if entries and "embedding" not in entries[0]:
+                if not self._embeddings_file.exists():
+                    return
+                matrix = np.load(self._embeddings_file).astype(np.float32)
+                if matrix.shape[0] != len(entries):
+                    return
+
             current_time = time.time()
-            for entry in data.get("entries", []):
+            for i, entry in enumerate(entries):
                 timestamp = entry.get("timestamp", 0)
                 expires_at = entry.get("expires_at")
 
@@ -271,20 +446,25 @@ class SemanticCache:
                 if not cache_key:
                     continue
 
+                if matrix is not None:
+                    embedding = np.asarray(matrix[i], dtype=np.float32)
+                else:
+                    embedding = np.array(entry.get("embedding", []), dtype=np.float32)
+
                 cached_response = CachedResponse(
                     query=entry.get("query", ""),
                     response=entry.get("response", ""),
-                    embedding=entry.get("embedding", []),
+                    embedding=[],
                     timestamp=entry.get("timestamp", current_time),
                     expires_at=expires_at,
                     hit_count=entry.get("hit_count", 0),
                 )
 
                 self._cache[cache_key] = cached_response
-                self._cache_keys.append(cache_key)
-                self._embeddings.append(
-                    np.array(cached_response.embedding, dtype=np.float32)
-                )
+                # Renormalize on load in case the file predates unit-vector
+                # storage
+                self._append_embedding(cache_key, _normalize(embedding))
+                heapq.heappush(self._expiry_heap, (expires_at, cache_key))
 
         except (json.JSONDecodeError, KeyError, ValueError, OSError):
             pass
@@ -309,23 +489,30 @@ class SemanticCache:
                 pass
 
     def _save_to_file(self) -> None:
-        """Save cache to JSON file."""
-        try:
-            entries = [
-                {
-                    "key": key,
-                    "query": cached.query,
-                    "response": cached.response,
-                    "embedding": cached.embedding,
-                    "timestamp": cached.timestamp,
-                    "expires_at": cached.expires_at,
-                    "hit_count": cached.hit_count,
-                }
-                for key, cached in self._cache.items()
-            ]
+        """Snapshot the cache and hand it to the background writer."""
+        entries = [
+            {
+                "key": key,
+                "query": cached.query,
+                "response": cached.response,
+                "timestamp": cached.timestamp,
+                "expires_at": cached.expires_at,
+                "hit_count": cached.hit_count,
+            }
+            for key, cached in self._cache.items()
+        ]
+
+        # Fancy indexing copies the rows, so the snapshot is immune to later
+        # mutation of the live matrix
+        if self._cache:
+            rows = [self._key_to_row[key] for key in self._cache]
+            embeddings = self._matrix[rows]
+        else:
+            embeddings = np.empty((0, 0), dtype=np.float32)
 
-            data = {
-                "version": "1.0",
+        snapshot = {
+            "data": {
+                "version": "2.0",
                 "entries": entries,
                 "metadata": {
                     "similarity_threshold": self.similarity_threshold,
@@ -333,15 +520,59 @@ class SemanticCache:
                     "ttl": self.ttl,
                     "embedding_model": self.embedding_model,
                 },
-            }
+            },
+            "embeddings": embeddings,
+        }
+
+        self._dirty = 0
+        self._last_save = time.monotonic()
 
+        # Replace any still-pending older snapshot with this one
+        try:
+            self._save_queue.put_nowait(snapshot)
+        except queue.Full:
+            try:
+                self._save_queue.get_nowait()
+                self._save_queue.task_done()
+            except queue.Empty:
+                pass
+            try:
+                self._save_queue.put_nowait(snapshot)
+            except queue.Full:
+                pass
+
+    def _save_loop(self) -> None:
+        """Background thread: write queued snapshots to disk."""
+        while True:
+            snapshot = self._save_queue.get()
+            try:
+                self._write_snapshot(snapshot)
+            finally:
+                self._save_queue.task_done()
+
+    def _write_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Write one snapshot to disk via atomic renames."""
+        try:
+            # Half-precision on disk halves the file; the worst-case cosine
+            # error (~1e-3 for unit vectors) is noise against the 0.85
+            # similarity threshold. Compute stays float32 in memory.
+            temp_emb = self._embeddings_file.with_suffix(".npy.tmp")
+            with open(temp_emb, "wb") as f:
+                np.save(f, snapshot["embeddings"].astype(np.float16))
+            temp_emb.replace(self._embeddings_file)
+
+            data = snapshot["data"]
             temp_file = self.cache_file.with_suffix(".tmp")
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                temp_file.write_bytes(orjson.dumps(data))
+            else:
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
 
             temp_file.replace(self.cache_file)
             logger.debug(
-                f"Cache saved to {self.cache_file} with {len(entries)} entries"
+                f"Cache saved to {self.cache_file} with "
+                f"{len(data['entries'])} entries"
             )
         except (OSError, ValueError, TypeError) as e:
             logger.warning(f"Failed to save cache file: {e}", exc_info=True)
@@ -1,10 +1,13 @@
 """Repository for cryptocurrency data access."""
 
+import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-from src.api.coingecko_client import CoinGeckoClient
-from src.api.fear_greed_client import FearGreedClient
+import numpy as np
+
+from src.api.coingecko_client import get_client as get_coingecko_client
+from src.api.fear_greed_client import get_client as get_fear_greed_client
 from src.api.newsapi_client import NewsAPIClient
 from src.core.cache import Cache
 from src.core.exceptions import APIError
@@ -15,6 +18,103 @@ from src.config.constants import DEFAULT_CACHE_TTL
 logger = get_logger(__name__)
 progress = get_progress_logger()
 
+# Compiled once; descriptions are stripped on every analysis
+_HTML_TAG_RE = re.compile(r"<[^<]+?>")
+
+# Fields exposed by get_market_data; the ones in _USD_KEYS are per-currency
+# dicts in the raw CoinGecko payload and are dereferenced to their USD value
+_MARKET_FIELDS = (
+    "current_price",
+    "market_cap",
+    "market_cap_rank",
+    "total_volume",
+    "high_24h",
+    "low_24h",
+    "price_change_24h",
+    "price_change_percentage_24h",
+    "price_change_percentage_7d",
+    "price_change_percentage_30d",
+    "circulating_supply",
+    "total_supply",
+    "max_supply",
+    "ath",
+    "atl",
+    "ath_date",
+    "atl_date",
+)
+_USD_KEYS = frozenset(
+    {
+        "current_price",
+        "market_cap",
+        "total_volume",
+        "high_24h",
+        "low_24h",
+        "ath",
+        "atl",
+        "ath_date",
+        "atl_date",
+    }
+)
+
+
+class PriceSeries:
+    """Columnar historical price series.
+
+    The market_chart response is kept as two parallel float64 arrays
+    instead of one dict per timestamp, so a 90-day hourly series costs two
+    allocations rather than thousands, and the analyzers consume the price
+    column directly without re-extracting it.
+    """
+
+    __slots__ = ("timestamps", "prices")
+
+    def __init__(self, raw_prices: List[List[float]]):
+        arr = np.asarray(raw_prices, dtype=np.float64).reshape(-1, 2)
+        self.timestamps = arr[:, 0]
+        self.prices = arr[:, 1]
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __bool__(self) -> bool:
+        return len(self.prices) > 0
+
+    def dates(self) -> List[datetime]:
+        """Materialize per-point datetimes (not needed on the hot paths)."""
+        return [datetime.fromtimestamp(ts / 1000) for ts in self.timestamps]
+
+
+class MarketDataView:
+    """Lazy read-only view over a raw CoinGecko market_data payload.
+
+    Fields are dereferenced on access instead of eagerly copied into a
+    fresh dict, so callers that read one or two fields skip the other
+    fifteen lookups. Supports the subscript/get access the analyzers use.
+    """
+
+    __slots__ = ("_md",)
+
+    def __init__(self, market_data: Dict[str, Any]):
+        self._md = market_data
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._md.get(key)
+        if key in _USD_KEYS and isinstance(value, dict):
+            return value.get("usd")
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._md:
+            return self[key]
+        return default
+
+    def __bool__(self) -> bool:
+        return bool(self._md)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the full field set for serializing callers."""
+        return {key: self[key] for key in _MARKET_FIELDS}
+
 
 class CoinRepository:
     """Repository for accessing cryptocurrency data with caching."""
@@ -29,8 +129,10 @@ class CoinRepository:
             cache_ttl: Cache time-to-live in seconds
             newsapi_key: Optional NewsAPI key for news features
         """
-        self.coingecko_client = CoinGeckoClient()
-        self.fear_greed_client = FearGreedClient()
+        # Shared process-wide clients: one connection pool, coin list and
+        # response cache regardless of how many repositories exist
+        self.coingecko_client = get_coingecko_client()
+        self.fear_greed_client = get_fear_greed_client()
         self.newsapi_client = NewsAPIClient(api_key=newsapi_key)
         self.cache = Cache(default_ttl=cache_ttl)
 
@@ -80,7 +182,11 @@ class CoinRepository:
 
         def fetch_with_error_handling():
             try:
-                return self.coingecko_client.get_coin_data(coin_id)
+                data = self.coingecko_client.get_coin_data(coin_id)
+                # Precompute the uppercased symbol once at ingestion so
+                # consumers don't re-allocate it on every analysis
+                data["symbol_upper"] = data.get("symbol", "").upper()
+                return data
             except APIError as e:
                 # If rate limited, try to return stale cache data
                 if e.status_code == 429:
@@ -90,9 +196,11 @@ class CoinRepository:
                         return cached
                 raise
 
-        return self.cache.get_or_fetch(cache_key, fetch_with_error_handling)
+        return self.cache.get_or_fetch(
+            cache_key, fetch_with_error_handling, refresh_ahead=True
+        )
 
-    def get_market_data(self, coin_id: str) -> Dict[str, Any]:
+    def get_market_data(self, coin_id: str) -> MarketDataView:
         """
         Get market data for a coin.
 
@@ -100,45 +208,27 @@ class CoinRepository:
             coin_id: CoinGecko coin ID
 
         Returns:
-            Market data dictionary
+            Lazy view over the market data fields (see MarketDataView)
         """
         data = self.get_coin_data(coin_id)
-        market_data = data.get("market_data", {})
+        return MarketDataView(data.get("market_data", {}))
 
-        # Helper function to safely extract USD value
-        def get_usd_value(key: str):
-            value = market_data.get(key)
-            if isinstance(value, dict):
-                return value.get("usd")
-            return value
+    def get_simple_prices(self, coin_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get current price, market cap, volume and 24h change for many coins.
 
-        return {
-            "current_price": get_usd_value("current_price"),
-            "market_cap": get_usd_value("market_cap"),
-            "market_cap_rank": market_data.get("market_cap_rank"),
-            "total_volume": get_usd_value("total_volume"),
-            "high_24h": get_usd_value("high_24h"),
-            "low_24h": get_usd_value("low_24h"),
-            "price_change_24h": market_data.get("price_change_24h"),
-            "price_change_percentage_24h": market_data.get(
-                "price_change_percentage_24h"
-            ),
-            "price_change_percentage_7d": market_data.get("price_change_percentage_7d"),
-            "price_change_percentage_30d": market_data.get(
-                "price_change_percentage_30d"
-            ),
-            "circulating_supply": market_data.get("circulating_supply"),
-            "total_supply": market_data.get("total_supply"),
-            "max_supply": market_data.get("max_supply"),
-            "ath": get_usd_value("ath"),
-            "atl": get_usd_value("atl"),
-            "ath_date": get_usd_value("ath_date"),
-            "atl_date": get_usd_value("atl_date"),
-        }
+        One batched simple/price request replaces a full coin-data fetch per
+        coin when only these scalar fields are needed.
 
-    def get_historical_prices(
-        self, coin_id: str, days: int = 30
-    ) -> List[Dict[str, Any]]:
+        Args:
+            coin_ids: CoinGecko coin IDs
+
+        Returns:
+            Mapping of coin ID to its scalar market fields
+        """
+        return self.coingecko_client.get_simple_price(coin_ids)
+
+    def get_historical_prices(self, coin_id: str, days: int = 30) -> PriceSeries:
         """
         Get historical price data.
 
@@ -147,7 +237,7 @@ class CoinRepository:
             days: Number of days of historical data
 
         Returns:
-            List of price data points
+            Columnar price series (see PriceSeries)
         """
         cache_key = f"historical_{coin_id}_{days}"
 
@@ -159,19 +249,11 @@ class CoinRepository:
 
         def fetch():
             data = self.coingecko_client.get_market_chart(coin_id, days)
-            prices = []
-            for timestamp, price in data.get("prices", []):
-                prices.append(
-                    {
-                        "timestamp": timestamp,
-                        "date": datetime.fromtimestamp(timestamp / 1000),
-                        "price": price,
-                    }
-                )
-            progress.success(f"Retrieved {len(prices)} price data points")
-            return prices
-
-        return self.cache.get_or_fetch(cache_key, fetch)
+            series = PriceSeries(data.get("prices", []))
+            progress.success(f"Retrieved {len(series)} price data points")
+            return series
+
+        return self.cache.get_or_fetch(cache_key, fetch, refresh_ahead=True)
 
     def get_community_data(self, coin_id: str) -> Dict[str, Any]:
         """
@@ -210,12 +292,7 @@ class CoinRepository:
         """
         data = self.get_coin_data(coin_id)
         description = data.get("description", {}).get("en", "")
-
-        # Remove HTML tags
-        import re
-
-        description = re.sub("<[^<]+?>", "", description)
-        return description
+        return _HTML_TAG_RE.sub("", description)
 
     def get_fear_greed_index(self) -> Dict[str, Any]:
         """
@@ -226,7 +303,10 @@ class CoinRepository:
         """
         cache_key = "fear_greed_index"
         return self.cache.get_or_fetch(
-            cache_key, self.fear_greed_client.get_fear_greed_index, ttl=3600
+            cache_key,
+            self.fear_greed_client.get_fear_greed_index,
+            ttl=3600,
+            refresh_ahead=True,
         )  # 1 hour cache for F&G index
 
     def get_news_articles(
@@ -1,5 +1,8 @@
 """Service for orchestrating cryptocurrency analyses."""
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+
 from src.repositories.coin_repository import CoinRepository
 from src.analyzers import (
     FundamentalAnalyzer,
@@ -26,6 +29,26 @@ class AnalysisService:
         self.sentiment_analyzer = SentimentAnalyzer(coin_repository)
         self.technical_analyzer = TechnicalAnalyzer(coin_repository)
 
+    def _resolve(self, query: str) -> Tuple[str, str]:
+        """
+        Resolve a query to its coin ID and display name in one pass.
+
+        One ID lookup and one coin-data fetch serve every perform_* method,
+        instead of each re-resolving the ID to get the name.
+
+        Args:
+            query: Cryptocurrency name or symbol
+
+        Returns:
+            Tuple of (coin_id, coin_name)
+
+        Raises:
+            CoinNotFoundError: If coin cannot be found
+        """
+        coin_id = self.repository.get_coin_id(query)
+        coin_name = self.repository.get_coin_data(coin_id).get("name", query)
+        return coin_id, coin_name
+
     def get_coin_name(self, query: str) -> str:
         """
         Get coin name from query.
@@ -39,9 +62,7 @@ class AnalysisService:
         Raises:
             CoinNotFoundError: If coin cannot be found
         """
-        coin_id = self.repository.get_coin_id(query)
-        data = self.repository.get_coin_data(coin_id)
-        return data.get("name", query)
+        return self._resolve(query)[1]
 
     def perform_fundamental_analysis(self, query: str) -> str:
         """
@@ -57,8 +78,7 @@ class AnalysisService:
             CoinNotFoundError: If coin cannot be found
             AnalysisError: If analysis fails
         """
-        coin_id = self.repository.get_coin_id(query)
-        coin_name = self.get_coin_name(query)
+        coin_id, coin_name = self._resolve(query)
         try:
             return self.fundamental_analyzer.analyze(coin_id, coin_name)
         except Exception as e:
@@ -78,8 +98,7 @@ class AnalysisService:
             CoinNotFoundError: If coin cannot be found
             AnalysisError: If analysis fails
         """
-        coin_id = self.repository.get_coin_id(query)
-        coin_name = self.get_coin_name(query)
+        coin_id, coin_name = self._resolve(query)
         try:
             return self.price_analyzer.analyze(coin_id, coin_name)
         except Exception as e:
@@ -99,8 +118,7 @@ class AnalysisService:
             CoinNotFoundError: If coin cannot be found
             AnalysisError: If analysis fails
         """
-        coin_id = self.repository.get_coin_id(query)
-        coin_name = self.get_coin_name(query)
+        coin_id, coin_name = self._resolve(query)
         try:
             return self.sentiment_analyzer.analyze(coin_id, coin_name)
         except Exception as e:
@@ -120,9 +138,47 @@ class AnalysisService:
             CoinNotFoundError: If coin cannot be found
             AnalysisError: If analysis fails
         """
-        coin_id = self.repository.get_coin_id(query)
-        coin_name = self.get_coin_name(query)
+        coin_id, coin_name = self._resolve(query)
         try:
             return self.technical_analyzer.analyze(coin_id, coin_name)
         except Exception as e:
             raise AnalysisError("technical", str(e))
+
+    def perform_full_analysis(self, query: str) -> Dict[str, str]:
+        """
+        Perform all four analyses concurrently.
+
+        The coin is resolved once, then the analyzers run on a small thread
+        pool; their network waits overlap instead of adding up, and the
+        shared cache collapses duplicate fetches across them.
+
+        Args:
+            query: Cryptocurrency name or symbol
+
+        Returns:
+            Mapping of analysis type to its report
+
+        Raises:
+            CoinNotFoundError: If coin cannot be found
+            AnalysisError: If any analysis fails
+        """
+        coin_id, coin_name = self._resolve(query)
+
+        analyzers = (
+            ("fundamental", self.fundamental_analyzer),
+            ("price", self.price_analyzer),
+            ("sentiment", self.sentiment_analyzer),
+            ("technical", self.technical_analyzer),
+        )
+        results: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=len(analyzers)) as executor:
+            futures = [
+                (analysis_type, executor.submit(analyzer.analyze, coin_id, coin_name))
+                for analysis_type, analyzer in analyzers
+            ]
+            for analysis_type, future in futures:
+                try:
+                    results[analysis_type] = future.result()
+                except Exception as e:
+                    raise AnalysisError(analysis_type, str(e))
+        return results
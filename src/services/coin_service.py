@@ -36,7 +36,59 @@ class CoinService:
         return {
             "coin_id": coin_id,
             "name": data.get("name", query),
-            "symbol": data.get("symbol", "").upper(),
+            "symbol": data.get("symbol_upper", ""),
         }
 
+    def get_coin_price(self, query: str) -> Dict[str, Any]:
+        """
+        Get current price and scalar market fields for a cryptocurrency.
+
+        Resolves the ID once and reads the batched simple/price endpoint,
+        so a price check costs one light request instead of the full
+        coins/{id} document.
+
+        Args:
+            query: Cryptocurrency name or symbol
+
+        Returns:
+            Dictionary with price, market cap, 24h volume and 24h change
+
+        Raises:
+            CoinNotFoundError: If coin cannot be found
+        """
+        coin_id = self.repository.get_coin_id(query)
+        prices = self.repository.get_simple_prices([coin_id]) or {}
+        fields = prices.get(coin_id, {})
+
+        return {
+            "coin_id": coin_id,
+            "price": fields.get("usd"),
+            "market_cap": fields.get("usd_market_cap"),
+            "volume_24h": fields.get("usd_24h_vol"),
+            "change_24h": fields.get("usd_24h_change"),
+        }
+
+    def get_coin_news(self, query: str, page_size: int = 10) -> Dict[str, Any]:
+        """
+        Get latest news articles for a cryptocurrency.
+
+        Resolves the coin once; the name and symbol the news lookup needs
+        come from the same cached coin-data fetch, so no lookup is repeated.
+
+        Args:
+            query: Cryptocurrency name or symbol
+            page_size: Number of articles to return (default: 10)
+
+        Returns:
+            Dictionary with coin info and its news articles
+
+        Raises:
+            CoinNotFoundError: If coin cannot be found
+        """
+        info = self.get_coin_info(query)
+        articles = self.repository.get_news_articles(
+            info["name"], info["symbol"], page_size=page_size
+        )
+        return {**info, "articles": articles}
+
 
@@ -1,27 +1,23 @@
 """Command-line interface for the crypto analysis agent."""
 
 import sys
+from functools import lru_cache
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.prompt import Prompt
 
 from src.config.settings import get_settings
-from src.agents.agent import CryptoAnalysisAgent
-
 
-class CLIInterface:
-    """Command-line interface for interacting with the crypto analysis agent."""
+# Command tables hoisted out of the input loop: frozenset membership is one
+# hash probe instead of a fresh list literal and linear scan per keystroke
+_EXIT_CMDS = frozenset({"exit", "quit", "q"})
+_CLEAR_CMDS = frozenset({"clear", "reset"})
+_HELP_CMDS = frozenset({"help", "h", "?"})
+_STATS_CMDS = frozenset({"cache", "stats"})
 
-    def __init__(self):
-        """Initialize CLI interface."""
-        self.console = Console()
-        self.settings = None
-        self.agent = None
-
-    def _print_welcome(self) -> None:
-        """Print welcome message."""
-        welcome_text = """
+_WELCOME_TEXT = """
 # Crypto Token Analysis Chat Agent
 
 Welcome! I'm your AI-powered cryptocurrency analyst. I can help you analyze tokens across multiple dimensions:
@@ -52,15 +48,9 @@ Welcome! I'm your AI-powered cryptocurrency analyst. I can help you analyze toke
 - Type 'help' for this message
 
 *Note: This is educational information, not financial advice. Cryptocurrency investments are risky. Always DYOR (Do Your Own Research).*
-        """
-
-        self.console.print(
-            Panel(Markdown(welcome_text), border_style="cyan", padding=(1, 2))
-        )
+"""
 
-    def _print_help(self) -> None:
-        """Print help message."""
-        help_text = """
+_HELP_TEXT = """
 # Help - How to Use This Agent
 
 **Basic Usage:**
@@ -92,11 +82,37 @@ I remember our conversation context! You can ask:
 - Be specific with token names or symbols (BTC, Bitcoin, etc.)
 - Ask follow-up questions naturally
 - Reference earlier analyses for comparisons
-        """
+"""
 
-        self.console.print(
-            Panel(Markdown(help_text), border_style="yellow", padding=(1, 2))
-        )
+
+@lru_cache(maxsize=1)
+def _welcome_panel() -> Panel:
+    """Build the static welcome panel once; Markdown parsing is not cheap."""
+    return Panel(Markdown(_WELCOME_TEXT), border_style="cyan", padding=(1, 2))
+
+
+@lru_cache(maxsize=1)
+def _help_panel() -> Panel:
+    """Build the static help panel once and reuse it across invocations."""
+    return Panel(Markdown(_HELP_TEXT), border_style="yellow", padding=(1, 2))
+
+
+class CLIInterface:
+    """Command-line interface for interacting with the crypto analysis agent."""
+
+    def __init__(self):
+        """Initialize CLI interface."""
+        self.console = Console()
+        self.settings = None
+        self.agent = None
+
+    def _print_welcome(self) -> None:
+        """Print welcome message."""
+        self.console.print(_welcome_panel())
+
+    def _print_help(self) -> None:
+        """Print help message."""
+        self.console.print(_help_panel())
 
     def _print_cache_stats(self) -> None:
         """Print semantic cache statistics."""
@@ -133,6 +149,11 @@ I remember our conversation context! You can ask:
         Returns:
             True if initialization successful, False otherwise
         """
+        # Imported here rather than at module top: the agent pulls in
+        # LangChain and the OpenAI SDK, which cost hundreds of ms the
+        # welcome screen and any early exit never need
+        from src.agents.agent import CryptoAnalysisAgent
+
         try:
             self.settings = get_settings()
         except ValueError as e:
@@ -195,22 +216,22 @@ I remember our conversation context! You can ask:
                 # Handle commands
                 user_input_lower = user_input.lower().strip()
 
-                if user_input_lower in ["exit", "quit", "q"]:
+                if user_input_lower in _EXIT_CMDS:
                     self.console.print(
                         "\n[yellow]Thanks for using Crypto Analysis Agent! Goodbye![/yellow]\n"
                     )
                     break
 
-                elif user_input_lower in ["clear", "reset"]:
+                elif user_input_lower in _CLEAR_CMDS:
                     self.agent.reset_conversation()
                     self.console.print("\n[green]Conversation memory cleared![/green]")
                     continue
 
-                elif user_input_lower in ["help", "h", "?"]:
+                elif user_input_lower in _HELP_CMDS:
                     self._print_help()
                     continue
 
-                elif user_input_lower in ["cache", "stats"]:
+                elif user_input_lower in _STATS_CMDS:
                     self._print_cache_stats()
                     continue
 